@@ -1426,7 +1426,9 @@ def create_book():
     return redirect(url_for("reading_list"))
 
 
-def _background_fetch_missing_data(job_id: str, credentials_dict, sheet_name: str):
+def _background_fetch_missing_data(
+    job_id: str, credentials_dict, sheet_name: str, spreadsheet_id=None
+):
     """Background task: bulk fetch missing data (covers, metadata) for all books."""
     from book_lamp.services.book_lookup import enhance_books_batch
 
@@ -1437,7 +1439,9 @@ def _background_fetch_missing_data(job_id: str, credentials_dict, sheet_name: st
             storage = _mock_storage_singleton
         else:
             storage = GoogleSheetsStorage(
-                sheet_name=sheet_name, credentials_dict=credentials_dict
+                sheet_name=sheet_name,
+                credentials_dict=credentials_dict,
+                spreadsheet_id=spreadsheet_id,
             )
 
         books = storage.get_all_books()
@@ -1481,6 +1485,7 @@ def fetch_missing_data():
         _background_fetch_missing_data,
         credentials_dict,
         sheet_name,
+        session.get("spreadsheet_id"),
     )
 
     flash(
@@ -1504,6 +1509,7 @@ def fetch_missing_categories():
         _background_fetch_missing_data,  # Reusing the background fetcher which now includes categories
         credentials_dict,
         sheet_name,
+        session.get("spreadsheet_id"),
     )
 
     flash(
@@ -1520,7 +1526,12 @@ def import_books_form():
 
 
 def _background_import_books(
-    job_id: str, content: str, fetch_metadata: bool, credentials_dict, sheet_name: str
+    job_id: str,
+    content: str,
+    fetch_metadata: bool,
+    credentials_dict,
+    sheet_name: str,
+    spreadsheet_id=None,
 ):
     """Background task: import books from Libib CSV."""
     app.logger.info(f"Background job {job_id}: parsing CSV content...")
@@ -1532,7 +1543,9 @@ def _background_import_books(
             storage = _mock_storage_singleton
         else:
             storage = GoogleSheetsStorage(
-                sheet_name=sheet_name, credentials_dict=credentials_dict
+                sheet_name=sheet_name,
+                credentials_dict=credentials_dict,
+                spreadsheet_id=spreadsheet_id,
             )
 
         items = parse_libib_csv(content)
@@ -1596,6 +1609,7 @@ def import_books():
             fetch_metadata,
             credentials_dict,
             sheet_name,
+            session.get("spreadsheet_id"),
         )
 
         flash(
@@ -33,6 +33,8 @@ class AsyncSQLiteStorage:
         self._outbox_seq = int(self._state.get("outbox_seq", 1))
         self._outbox: dict[int, dict[str, Any]] = {}
         self._metrics: dict[str, int] = {"processed": 0, "failed": 0, "retried": 0}
+        # Local book ID -> ID the sheet assigned, where the two differ
+        self._remote_book_ids: dict[int, int] = {}
         self._worker = threading.Thread(target=self._sync_worker, daemon=True)
         self._worker.start()
         self._load_state()
@@ -93,6 +95,9 @@ class AsyncSQLiteStorage:
                 + 1
             )
             self._spreadsheet_id = remote.spreadsheet_id
+            # Local books now carry the sheet's own IDs
+            self._remote_book_ids = {}
+            self._save_remote_book_ids()
             self._save_state()
             self._bootstrapped = True
             logger.info("AsyncSQLiteStorage bootstrap complete.")
@@ -167,9 +172,13 @@ class AsyncSQLiteStorage:
 
                 remote = self._new_remote()
                 op = entry["op"]
-                payload = entry["payload"]
+                payload = self._to_remote_ids(entry["payload"])
                 if op == "add_book":
-                    remote.add_book(**payload)
+                    local_id = payload.pop("local_id", None)
+                    added = remote.add_book(**payload)
+                    if local_id is not None and added["id"] != local_id:
+                        self._remote_book_ids[local_id] = added["id"]
+                        self._save_remote_book_ids()
                 elif op == "update_book":
                     remote.update_book(**payload)
                 elif op == "delete_book":
@@ -227,6 +236,20 @@ class AsyncSQLiteStorage:
             finally:
                 self._queue.task_done()
 
+    def _to_remote_ids(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Copy a payload with local book IDs swapped for the sheet's IDs."""
+        out = dict(payload)
+        ids = self._remote_book_ids
+        if "book_id" in out:
+            out["book_id"] = ids.get(out["book_id"], out["book_id"])
+        if "book_ids" in out:
+            out["book_ids"] = [ids.get(book_id, book_id) for book_id in out["book_ids"]]
+        return out
+
+    def _save_remote_book_ids(self) -> None:
+        # Stored as pairs because JSON object keys are always strings
+        self._state.set("remote_book_ids", list(self._remote_book_ids.items()))
+
     def _load_state(self) -> None:
         self._local.books = self._state.get("books", [])
         self._local.reading_records = self._state.get("reading_records", [])
@@ -236,6 +259,10 @@ class AsyncSQLiteStorage:
         self._local.next_book_id = self._state.get("next_book_id", 1)
         self._local.next_record_id = self._state.get("next_record_id", 1)
         self._spreadsheet_id = self._state.get("spreadsheet_id", None)
+        self._remote_book_ids = {
+            int(local): int(remote)
+            for local, remote in self._state.get("remote_book_ids", [])
+        }
         self._bootstrapped = bool(self._local.books or self._local.reading_records)
         self._outbox = {
             int(item["id"]): item
@@ -334,15 +361,17 @@ class AsyncSQLiteStorage:
         self._ensure_bootstrap_started()
         return self._local.get_recommendations()
 
-    def search(self, query: str) -> list[dict[str, Any]]:
+    def search(self, query: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
         self._ensure_bootstrap_started()
-        return self._local.search(query)
+        return self._local.search(query, limit=limit)
 
     # --- write operations ---
     def add_book(self, **kwargs: Any) -> dict[str, Any]:
         out = self._local.add_book(**kwargs)
         self._save_state()
-        self._enqueue("add_book", kwargs)
+        # The sheet assigns its own ID; later ops are mapped onto it if the
+        # two differ, e.g. when another session added books meanwhile
+        self._enqueue("add_book", {**kwargs, "local_id": out["id"]})
         return out
 
     def update_book(self, **kwargs: Any) -> dict[str, Any]:
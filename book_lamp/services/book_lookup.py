@@ -4,11 +4,14 @@ import re
 from typing import Any, Dict, List, Optional, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from book_lamp.services.cache import get_cache
 from book_lamp.utils.books import (
     isbn13_to_isbn10,
     normalize_isbn,
+    parse_bisac_category,
+    parse_publication_year,
 )
 
 logger = logging.getLogger("book_lamp")
@@ -21,6 +24,11 @@ ITUNES_API = "https://itunes.apple.com/search"
 # Shared session for connection pooling and consistent headers.
 _session: Optional[requests.Session] = None
 
+# Enough pooled connections per host for the enhance_books_batch workers,
+# each of which may fan out to several providers.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
 
 def _get_session() -> requests.Session:
     """Get or create a shared requests session with a proper User-Agent.
@@ -37,6 +45,14 @@ def _get_session() -> requests.Session:
                 "User-Agent": "BookLamp/1.0 (personal reading tracker; https://github.com/book-lamp)",
             }
         )
+        # Size the pool for concurrent lookups so worker threads reuse warm
+        # TLS connections instead of discarding them when the pool is full.
+        adapter = HTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
     return _session
 
 
@@ -102,8 +118,6 @@ def _parse_open_library_data(data: Dict[str, Any]) -> Dict[str, Any]:
         first_pub = publisher_list[0] or {}
         publisher_name = first_pub.get("name")
 
-    from book_lamp.utils.books import parse_bisac_category
-
     description = data.get("notes")
     subjects = data.get("subjects") or []
     # Extract the name from the first subject if it's a dict, otherwise use it as-is
@@ -497,8 +511,6 @@ def _parse_google_books_item(item: Dict[str, Any]) -> Dict[str, Optional[Any]]:
         image_links.get("thumbnail") or image_links.get("smallThumbnail")
     )
 
-    from book_lamp.utils.books import parse_bisac_category
-
     bisac = ", ".join(info.get("categories", [])) if info.get("categories") else None
     main_cat, sub_cat = parse_bisac_category(bisac)
 
@@ -790,6 +802,32 @@ def lookup_book_by_isbn13(
     return None
 
 
+# Book fields copied from lookup results when missing; names match on both sides.
+_ENHANCE_FIELDS = (
+    "thumbnail_url",
+    "cover_url",
+    "title",
+    "author",
+    "publisher",
+    "description",
+    "bisac_category",
+    "bisac_main_category",
+    "bisac_sub_category",
+    "language",
+    "page_count",
+    "physical_format",
+    "edition",
+)
+
+# Lookup APIs occasionally return very long titles/author lists; cap them.
+_MAX_FIELD_LENGTHS = {"title": 300, "author": 200}
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a metadata value is missing or blank."""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
 def _empty_result() -> Dict[str, Optional[Any]]:
     """Create an empty metadata template."""
     return {
@@ -818,10 +856,7 @@ def enhance_books_batch(
     Updates the books list in-place.
     Returns the number of books successfully updated.
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
-    def is_empty(value):
-        return value is None or (isinstance(value, str) and not value.strip())
+    from concurrent.futures import ThreadPoolExecutor
 
     def needs_update(field, current_val):
         # If forcing refresh, we consider almost everything updateable
@@ -831,11 +866,11 @@ def enhance_books_batch(
             return True
 
         # Special case for BISAC transition: allow updating if current value is numeric
-        if field == "bisac_category" and not is_empty(current_val):
+        if field == "bisac_category" and not _is_empty(current_val):
             # If it looks like a Dewey code (only digits/dots/spaces), mark as updateable
             if all(c.isdigit() or c in ". " for c in str(current_val)):
                 return True
-        return is_empty(current_val)
+        return _is_empty(current_val)
 
     candidates = []
     for b in books:
@@ -896,12 +931,8 @@ def enhance_books_batch(
     found_count = sum(1 for v in batch_results.values() if v is not None)
     logger.info(f"Batch lookup returned data for {found_count}/{len(all_isbns)} books")
 
-    updated_count = 0
-
     def process_book(book_item):
-        from book_lamp.utils.books import normalize_isbn as _normalize_isbn
-
-        isbn = _normalize_isbn(book_item.get("isbn13", ""))
+        isbn = normalize_isbn(book_item.get("isbn13", ""))
         title = book_item.get("title", "Unknown")
         try:
             # Try batch result first (normalized ISBN lookup)
@@ -934,43 +965,26 @@ def enhance_books_batch(
 
             logger.debug(f"Found data from {source} for {title}: {info}")
 
-            has_updates = False
-            # Map fields safely
-            field_map = {
-                "thumbnail_url": "thumbnail_url",
-                "cover_url": "cover_url",
-                "title": "title",
-                "author": "author",
-                "publisher": "publisher",
-                "description": "description",
-                "bisac_category": "bisac_category",
-                "bisac_main_category": "bisac_main_category",
-                "bisac_sub_category": "bisac_sub_category",
-                "language": "language",
-                "page_count": "page_count",
-                "physical_format": "physical_format",
-                "edition": "edition",
-            }
-
-            for target, source_field in field_map.items():
-                if needs_update(target, book_item.get(target)) and info.get(
-                    source_field
-                ):
-                    val = info[source_field]
-                    # Specific handling for strings/lengths
-                    if isinstance(val, str):
-                        if target == "title" and len(val) > 300:
-                            val = val[:300]
-                        if target == "author" and len(val) > 200:
-                            val = val[:200]
-                    book_item[target] = val
-                    has_updates = True
-                    logger.debug(f"Updated {target} for {title}: {val}")
+            # Decide which of the book's fields may change once, up front
+            updatable = (
+                _ENHANCE_FIELDS
+                if force_refresh
+                else [f for f in _ENHANCE_FIELDS if needs_update(f, book_item.get(f))]
+            )
+            updates = {field: info[field] for field in updatable if info.get(field)}
+            for field, max_length in _MAX_FIELD_LENGTHS.items():
+                val = updates.get(field)
+                if isinstance(val, str) and len(val) > max_length:
+                    updates[field] = val[:max_length]
+            book_item.update(updates)
+            has_updates = bool(updates)
+            if updates:
+                logger.debug(f"Updated {sorted(updates)} for {title}")
 
             # Special handling for publication_year
-            if is_empty(book_item.get("publication_year")) and info.get("publish_date"):
-                from book_lamp.utils.books import parse_publication_year
-
+            if _is_empty(book_item.get("publication_year")) and info.get(
+                "publish_date"
+            ):
                 year = parse_publication_year(info["publish_date"])
                 if year:
                     book_item["publication_year"] = year
@@ -988,10 +1002,9 @@ def enhance_books_batch(
             return False
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_book, b): b for b in candidates}
-        for future in as_completed(futures):
-            if future.result():
-                updated_count += 1
+        updated_count = sum(
+            1 for updated in executor.map(process_book, candidates) if updated
+        )
 
     logger.info(f"Successfully updated {updated_count} books")
     return updated_count
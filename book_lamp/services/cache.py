@@ -2,11 +2,47 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import time
-from typing import Any, Optional, Union
+import zlib
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Union
 
 logger = logging.getLogger("book_lamp.cache")
 
+# How often the application cache purges expired rows (seconds)
+CLEANUP_INTERVAL = 3600
+
+# Reclaim file space once a cleanup removes at least this many rows
+COMPACT_THRESHOLD = 1000
+
+# Serialised values longer than this are stored zlib-compressed
+COMPRESS_MIN_BYTES = 512
+
+# Leading byte marking a compressed BLOB value
+_ZLIB_MARKER = b"\x01"
+
+
+def _encode(value: Any) -> Union[str, bytes]:
+    """Serialise a cache value compactly.
+
+    Skipping whitespace and ASCII escaping keeps rows small and avoids the
+    per-character escape pass for non-ASCII titles and descriptions. Large
+    payloads such as full API responses are compressed into a marked BLOB.
+    """
+    text = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    data = text.encode("utf-8")
+    if len(data) <= COMPRESS_MIN_BYTES:
+        return text
+    return _ZLIB_MARKER + zlib.compress(data, 6)
+
+
+def _decode(raw: Union[str, bytes]) -> Any:
+    """Reverse _encode, accepting plain JSON text or a marked BLOB."""
+    if isinstance(raw, bytes) and raw[:1] == _ZLIB_MARKER:
+        raw = zlib.decompress(raw[1:])
+    return json.loads(raw)
+
 
 class SQLiteCache:
     """A simple persistent cache using SQLite.
@@ -28,13 +64,24 @@ class SQLiteCache:
 
         self.db_path = db_path
         self.default_ttl = default_ttl
+        self._cleanup_timer: Optional[threading.Timer] = None
         self._init_db()
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
     def _init_db(self):
         """Create the cache table if it doesn't exist."""
         try:
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expiry INTEGER)"
                 )
@@ -49,12 +96,12 @@ class SQLiteCache:
         """
         now = int(time.time())
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 row = conn.execute(
                     "SELECT value FROM cache WHERE key = ? AND expiry > ?", (key, now)
                 ).fetchone()
                 if row:
-                    return json.loads(row[0])
+                    return _decode(row[0])
         except Exception as e:
             logger.debug(f"Cache miss or error for key {key}: {e}")
         return None
@@ -64,11 +111,11 @@ class SQLiteCache:
         ttl = ttl if ttl is not None else self.default_ttl
         expiry = int(time.time()) + ttl
         try:
-            value_json = json.dumps(value)
-            with sqlite3.connect(self.db_path) as conn:
+            encoded = _encode(value)
+            with self._connect() as conn:
                 conn.execute(
                     "INSERT OR REPLACE INTO cache (key, value, expiry) VALUES (?, ?, ?)",
-                    (key, value_json, expiry),
+                    (key, encoded, expiry),
                 )
         except Exception as e:
             logger.error(f"Failed to store value in cache for key {key}: {e}")
@@ -76,20 +123,50 @@ class SQLiteCache:
     def delete(self, key: str):
         """Delete a single key from the cache."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("DELETE FROM cache WHERE key = ?", (key,))
         except Exception as e:
             logger.error(f"Failed to delete key {key} from cache: {e}")
 
-    def cleanup(self):
-        """Remove expired entries from the cache."""
+    def cleanup(self) -> int:
+        """Remove expired entries from the cache.
+
+        Returns the number of entries removed.
+        """
         now = int(time.time())
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute("DELETE FROM cache WHERE expiry <= ?", (now,))
+                # Refresh query planner statistics while we have the connection
+                conn.execute("PRAGMA optimize")
                 logger.info(f"Cleaned up {cursor.rowcount} expired cache entries")
+                return cursor.rowcount
         except Exception as e:
             logger.error(f"Failed to cleanup cache: {e}")
+        return 0
+
+    def compact(self):
+        """Rebuild the database file to reclaim space freed by deletions."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # VACUUM cannot run inside a transaction
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Failed to compact cache: {e}")
+
+    def schedule_cleanup(self, interval: int = CLEANUP_INTERVAL):
+        """Purge expired entries every `interval` seconds on a daemon timer."""
+        self._cleanup_timer = threading.Timer(interval, self._cleanup_and_reschedule)
+        self._cleanup_timer.daemon = True
+        self._cleanup_timer.start()
+
+    def _cleanup_and_reschedule(self):
+        if self.cleanup() >= COMPACT_THRESHOLD:
+            self.compact()
+        self.schedule_cleanup()
 
 
 # Singleton instance for the application
@@ -108,7 +185,10 @@ class NoOpCache:
     def delete(self, key: str):
         pass
 
-    def cleanup(self):
+    def cleanup(self) -> int:
+        return 0
+
+    def compact(self):
         pass
 
 
@@ -123,4 +203,5 @@ def get_cache() -> Union[SQLiteCache, NoOpCache]:
         ):
             return NoOpCache()
         _cache_instance = SQLiteCache()
+        _cache_instance.schedule_cleanup()
     return _cache_instance
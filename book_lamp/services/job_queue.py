@@ -1,16 +1,25 @@
 """Background job queue system for long-running operations."""
 
 import logging
+import os
+import queue
 import threading
 import time
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Callable, Optional
 
 logger = logging.getLogger("book_lamp")
 
+_QueuedTask = tuple[str, Callable[[], None]]
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.fromtimestamp(time.time(), timezone.utc).isoformat()
+
 
 class JobStatus(Enum):
     """Job execution status."""
@@ -34,6 +43,9 @@ class Job:
     progress: int = 0  # 0-100
     result: Optional[str] = None
     error: Optional[str] = None
+    _done: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -54,20 +66,29 @@ class Job:
 
         Returns True if job completed, False if timeout.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            if self.status in (JobStatus.COMPLETED, JobStatus.FAILED):
-                return True
-            time.sleep(0.1)
-        return False
+        return self._done.wait(timeout)
 
 
 class JobQueue:
     """Simple in-memory job queue with file-based persistence."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         self.jobs: dict[str, Job] = {}
         self._lock = threading.Lock()
+        if max_workers is None:
+            raw = os.environ.get("JOB_QUEUE_WORKERS", "8")
+            try:
+                max_workers = int(raw)
+            except ValueError:
+                logger.warning(f"Invalid JOB_QUEUE_WORKERS {raw!r}; using 8")
+                max_workers = 8
+        # Reuse a bounded pool of worker threads rather than spawning one per
+        # job. They are daemon threads (unlike ThreadPoolExecutor's, which the
+        # interpreter joins on exit) so running jobs never delay shutdown.
+        self._max_workers = max(1, max_workers)
+        # Each entry pairs a job ID with its runner; None tells a worker to exit
+        self._tasks: "queue.SimpleQueue[Optional[_QueuedTask]]" = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
 
     def create_job(self, function_name: str) -> str:
         """Create a new job and return its ID."""
@@ -76,7 +97,7 @@ class JobQueue:
             id=job_id,
             status=JobStatus.PENDING,
             function_name=function_name,
-            created_at=datetime.now(timezone.utc).isoformat(),
+            created_at=_now_iso(),
         )
         with self._lock:
             self.jobs[job_id] = job
@@ -90,46 +111,54 @@ class JobQueue:
 
     def start_job(self, job_id: str) -> bool:
         """Mark job as running."""
+        now = _now_iso()
         with self._lock:
             job = self.jobs.get(job_id)
             if job:
                 job.status = JobStatus.RUNNING
-                job.started_at = datetime.now(timezone.utc).isoformat()
+                job.started_at = now
                 logger.info(f"Started job {job_id}")
                 return True
         return False
 
     def update_progress(self, job_id: str, progress: int) -> bool:
-        """Update job progress (0-100)."""
-        progress = max(0, min(100, progress))
-        with self._lock:
-            job = self.jobs.get(job_id)
-            if job:
-                job.progress = progress
-                return True
+        """Update job progress (0-100).
+
+        Progress is a single best-effort int that readers poll, so it is set
+        without taking the lock; dict reads and attribute writes are atomic
+        under the GIL. Status transitions still take the lock.
+        """
+        job = self.jobs.get(job_id)
+        if job:
+            job.progress = max(0, min(100, progress))
+            return True
         return False
 
     def complete_job(self, job_id: str, result: Optional[str] = None) -> bool:
         """Mark job as completed successfully."""
+        now = _now_iso()
         with self._lock:
             job = self.jobs.get(job_id)
             if job:
                 job.status = JobStatus.COMPLETED
-                job.completed_at = datetime.now(timezone.utc).isoformat()
+                job.completed_at = now
                 job.result = result
                 job.progress = 100
+                job._done.set()
                 logger.info(f"Completed job {job_id}")
                 return True
         return False
 
     def fail_job(self, job_id: str, error: str) -> bool:
         """Mark job as failed."""
+        now = _now_iso()
         with self._lock:
             job = self.jobs.get(job_id)
             if job:
                 job.status = JobStatus.FAILED
-                job.completed_at = datetime.now(timezone.utc).isoformat()
+                job.completed_at = now
                 job.error = error
+                job._done.set()
                 logger.error(f"Failed job {job_id}: {error}")
                 return True
         return False
@@ -150,12 +179,38 @@ class JobQueue:
                 logger.exception(f"Job {job_id} failed with exception")
                 self.fail_job(job_id, str(e))
 
-        # Start in background thread (daemon=True so it doesn't prevent app shutdown)
-        thread = threading.Thread(target=run_task, daemon=True)
-        thread.start()
+        self._tasks.put((job_id, run_task))
+        with self._lock:
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"jobqueue_{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
 
         return job_id
 
+    def _work(self) -> None:
+        """Run queued tasks until told to stop."""
+        while (item := self._tasks.get()) is not None:
+            item[1]()
+
+    def shutdown(self) -> None:
+        """Cancel jobs that have not started and let the workers exit."""
+        while True:
+            try:
+                item = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.fail_job(item[0], "cancelled")
+        with self._lock:
+            for _ in self._workers:
+                self._tasks.put(None)
+            self._workers = []
+
 
 # Global job queue instance
 _job_queue = JobQueue()
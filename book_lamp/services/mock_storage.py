@@ -1,7 +1,16 @@
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Any, Optional
 
+from book_lamp.services.search import (
+    compile_query,
+    may_contain,
+    search_books,
+    searchable_text,
+)
+from book_lamp.utils.authors import split_authors
+from book_lamp.utils.books import normalize_isbn
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +23,12 @@ class MockStorage:
     ) -> None:
         self.sheet_name = sheet_name
         self.spreadsheet_id = spreadsheet_id
+        self._books_by_id: dict[int, dict[str, Any]] = {}
+        self._books_by_isbn: dict[str, dict[str, Any]] = {}
+        self._records_by_book: dict[int, list[dict[str, Any]]] = {}
+        self._records_by_id: dict[int, dict[str, Any]] = {}
+        # Lowercased searchable text per book id, built lazily by search()
+        self._search_text: dict[int, str] = {}
         self.books: list[dict[str, Any]] = []
         self.reading_records: list[dict[str, Any]] = []
         self.reading_list: list[dict[str, Any]] = []
@@ -23,6 +38,36 @@ class MockStorage:
         self.next_record_id = 1
         self._authorised = False  # Default to False for security and testing
 
+    @property
+    def books(self) -> list[dict[str, Any]]:
+        return self._books
+
+    @books.setter
+    def books(self, books: list[dict[str, Any]]) -> None:
+        """Replace all books and rebuild the id and ISBN indexes."""
+        self._books = books
+        self._search_text = {}
+        self._books_by_id = {}
+        self._books_by_isbn = {}
+        for book in books:
+            self._books_by_id.setdefault(book["id"], book)
+            self._books_by_isbn.setdefault(normalize_isbn(book["isbn13"]), book)
+
+    @property
+    def reading_records(self) -> list[dict[str, Any]]:
+        return self._reading_records
+
+    @reading_records.setter
+    def reading_records(self, records: list[dict[str, Any]]) -> None:
+        """Replace all reading records and rebuild the per-book index."""
+        self._reading_records = records
+        self._search_text = {}
+        self._records_by_book = {}
+        self._records_by_id = {}
+        for record in records:
+            self._records_by_book.setdefault(record["book_id"], []).append(record)
+            self._records_by_id.setdefault(record["id"], record)
+
     def prefetch(self) -> None:
         """Mock implementation of prefetch - does nothing as data is already in memory."""
         pass
@@ -41,27 +86,15 @@ class MockStorage:
     def get_reading_records(
         self, book_id: Optional[int] = None
     ) -> list[dict[str, Any]]:
-        records = []
         if book_id is None:
-            records = list(self.reading_records)
-        else:
-            records = [r for r in self.reading_records if r["book_id"] == book_id]
-        return records
+            return list(self.reading_records)
+        return list(self._records_by_book.get(book_id, []))
 
     def get_book_by_id(self, book_id: int) -> Optional[dict[str, Any]]:
-        for book in self.books:
-            if book["id"] == book_id:
-                return book
-        return None
+        return self._books_by_id.get(book_id)
 
     def get_book_by_isbn(self, isbn13: str) -> Optional[dict[str, Any]]:
-        from book_lamp.utils.books import normalize_isbn
-
-        target_isbn = normalize_isbn(isbn13)
-        for book in self.books:
-            if normalize_isbn(book["isbn13"]) == target_isbn:
-                return book
-        return None
+        return self._books_by_isbn.get(normalize_isbn(isbn13))
 
     def add_book(
         self,
@@ -82,10 +115,7 @@ class MockStorage:
         edition: Optional[str] = None,
         cover_url: Optional[str] = None,
     ) -> dict[str, Any]:
-        from book_lamp.utils.authors import split_authors
-        from book_lamp.utils.books import normalize_isbn
-
-        book = {
+        book: dict[str, Any] = {
             "id": self.next_book_id,
             "isbn13": normalize_isbn(isbn13),
             "title": title,
@@ -107,6 +137,8 @@ class MockStorage:
             "cover_url": cover_url,
         }
         self.books.append(book)
+        self._books_by_id[book["id"]] = book
+        self._books_by_isbn.setdefault(book["isbn13"], book)
         self.next_book_id += 1
         return book
 
@@ -130,61 +162,68 @@ class MockStorage:
         edition: Optional[str] = None,
         cover_url: Optional[str] = None,
     ) -> dict[str, Any]:
-        from book_lamp.utils.authors import split_authors
-
-        for book in self.books:
-            if book["id"] == book_id:
-                # Mirror BISAC prioritization logic
-                new_bisac = bisac_category
-                existing_bisac = book.get("bisac_category")
-
-                def is_dewey(val):
-                    if not val:
-                        return False
-                    return all(c.isdigit() or c in ". " for c in str(val))
-
-                if new_bisac and not is_dewey(new_bisac):
-                    final_bisac: Optional[str] = new_bisac
-                    final_bisac_main: Optional[str] = bisac_main_category or book.get(
-                        "bisac_main_category"
-                    )
-                    final_bisac_sub: Optional[str] = bisac_sub_category or book.get(
-                        "bisac_sub_category"
-                    )
-                else:
-                    final_bisac = existing_bisac or new_bisac
-                    final_bisac_main = (
-                        book.get("bisac_main_category") or bisac_main_category
-                    )
-                    final_bisac_sub = (
-                        book.get("bisac_sub_category") or bisac_sub_category
-                    )
-
-                book.update(
-                    {
-                        "isbn13": isbn13,
-                        "title": title,
-                        "author": author,
-                        "authors": split_authors(author),
-                        "publication_year": publication_year,
-                        "thumbnail_url": thumbnail_url or book.get("thumbnail_url"),
-                        "publisher": publisher or book.get("publisher"),
-                        "description": description or book.get("description"),
-                        "series": series or book.get("series"),
-                        "bisac_category": final_bisac,
-                        "bisac_main_category": final_bisac_main,
-                        "bisac_sub_category": final_bisac_sub,
-                        "language": language or book.get("language"),
-                        "page_count": page_count or book.get("page_count"),
-                        "physical_format": physical_format
-                        or book.get("physical_format"),
-                        "edition": edition or book.get("edition"),
-                        "cover_url": cover_url or book.get("cover_url"),
-                    }
-                )
-                return book
-        logger.error(f"Book with ID {book_id} not found")
-        raise Exception(f"Book with ID {book_id} not found")
+        book = self._books_by_id.get(book_id)
+        if book is None:
+            logger.error(f"Book with ID {book_id} not found")
+            raise Exception(f"Book with ID {book_id} not found")
+
+        # Mirror BISAC prioritization logic
+        new_bisac = bisac_category
+        existing_bisac = book.get("bisac_category")
+
+        def is_dewey(val):
+            if not val:
+                return False
+            return all(c.isdigit() or c in ". " for c in str(val))
+
+        if new_bisac and not is_dewey(new_bisac):
+            final_bisac: Optional[str] = new_bisac
+            final_bisac_main: Optional[str] = bisac_main_category or book.get(
+                "bisac_main_category"
+            )
+            final_bisac_sub: Optional[str] = bisac_sub_category or book.get(
+                "bisac_sub_category"
+            )
+        else:
+            final_bisac = existing_bisac or new_bisac
+            final_bisac_main = book.get("bisac_main_category") or bisac_main_category
+            final_bisac_sub = book.get("bisac_sub_category") or bisac_sub_category
+
+        old_isbn = book["isbn13"]
+        book["isbn13"] = isbn13
+        book["title"] = title
+        # Always re-split: callers may have edited the stored dict in place
+        book["authors"] = split_authors(author)
+        book["author"] = author
+        book["publication_year"] = publication_year
+        book["bisac_category"] = final_bisac
+        book["bisac_main_category"] = final_bisac_main
+        book["bisac_sub_category"] = final_bisac_sub
+        # Optional fields only overwrite the stored value when provided
+        for field, value in (
+            ("thumbnail_url", thumbnail_url),
+            ("publisher", publisher),
+            ("description", description),
+            ("series", series),
+            ("language", language),
+            ("page_count", page_count),
+            ("physical_format", physical_format),
+            ("edition", edition),
+            ("cover_url", cover_url),
+        ):
+            if value:
+                book[field] = value
+            else:
+                book.setdefault(field, None)
+        self._search_text.pop(book_id, None)
+        if isbn13 != old_isbn:
+            old_key = normalize_isbn(old_isbn)
+            new_key = normalize_isbn(isbn13)
+            if new_key != old_key:
+                if self._books_by_isbn.get(old_key) is book:
+                    del self._books_by_isbn[old_key]
+                self._books_by_isbn.setdefault(new_key, book)
+        return book
 
     def upsert_book(
         self,
@@ -254,7 +293,7 @@ class MockStorage:
         end_date: Optional[str] = None,
         rating: int = 0,
     ) -> dict[str, Any]:
-        record = {
+        record: dict[str, Any] = {
             "id": self.next_record_id,
             "book_id": book_id,
             "status": status,
@@ -264,6 +303,9 @@ class MockStorage:
             "created_at": "2024-01-01T00:00:00",
         }
         self.reading_records.append(record)
+        self._records_by_book.setdefault(book_id, []).append(record)
+        self._records_by_id[record["id"]] = record
+        self._search_text.pop(book_id, None)
         self.next_record_id += 1
         logger.info(
             f"READING_RECORD_ADDED: book_id={book_id}, status='{status}', id={record['id']}"
@@ -278,37 +320,47 @@ class MockStorage:
         end_date: Optional[str] = None,
         rating: int = 0,
     ) -> dict[str, Any]:
-        for record in self.reading_records:
-            if record["id"] == record_id:
-                old_status = record.get("status")
-                record.update(
-                    {
-                        "status": status,
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "rating": rating,
-                    }
-                )
-                logger.info(
-                    f"READING_RECORD_UPDATED: id={record_id}, status_change='{old_status}'->'{status}'"
-                )
-                return record
-        logger.error(f"Reading record with ID {record_id} not found")
-        raise Exception(f"Reading record with ID {record_id} not found")
+        record = self._records_by_id.get(record_id)
+        if record is None:
+            logger.error(f"Reading record with ID {record_id} not found")
+            raise Exception(f"Reading record with ID {record_id} not found")
+        old_status = record.get("status")
+        record.update(
+            {
+                "status": status,
+                "start_date": start_date,
+                "end_date": end_date,
+                "rating": rating,
+            }
+        )
+        self._search_text.pop(record["book_id"], None)
+        logger.info(
+            f"READING_RECORD_UPDATED: id={record_id}, status_change='{old_status}'->'{status}'"
+        )
+        return record
 
     def delete_reading_record(self, record_id: int) -> bool:
-        for i, record in enumerate(self.reading_records):
-            if record["id"] == record_id:
-                self.reading_records.pop(i)
-                return True
-        return False
+        record = self._records_by_id.pop(record_id, None)
+        if record is None:
+            return False
+        # Ids are unique, so list.remove finds this very record
+        self.reading_records.remove(record)
+        book_records = self._records_by_book.get(record["book_id"], [])
+        if record in book_records:
+            book_records.remove(record)
+        self._search_text.pop(record["book_id"], None)
+        return True
 
     def delete_book(self, book_id: int) -> bool:
-        for i, book in enumerate(self.books):
-            if book["id"] == book_id:
-                self.books.pop(i)
-                return True
-        return False
+        book = self._books_by_id.pop(book_id, None)
+        if book is None:
+            return False
+        self._search_text.pop(book_id, None)
+        isbn = normalize_isbn(book["isbn13"])
+        if self._books_by_isbn.get(isbn) is book:
+            del self._books_by_isbn[isbn]
+        self.books.remove(book)
+        return True
 
     def get_reading_list(self) -> list[dict[str, Any]]:
         return sorted(self.reading_list, key=lambda x: x["position"])
@@ -349,6 +401,11 @@ class MockStorage:
 
     def bulk_import(self, items: list[dict[str, Any]]) -> int:
         import_count = 0
+        # Exact record keys, so repeated imports skip duplicates with one lookup
+        seen_records = {
+            (r["book_id"], r["status"], r["start_date"], r.get("end_date"))
+            for r in self.reading_records
+        }
         for item in items:
             book_data = item["book"]
             record_data = item["record"]
@@ -373,48 +430,61 @@ class MockStorage:
             )
 
             if record_data:
-                is_duplicate = False
                 matched_record = None
 
                 r_status = record_data["status"]
                 r_start = record_data["start_date"]
                 r_end = record_data.get("end_date")
+                record_key = (book["id"], r_status, r_start, r_end)
+                is_duplicate = record_key in seen_records
 
-                for r in self.reading_records:
-                    if r["book_id"] == book["id"]:
-                        ek_status = r["status"]
-                        ek_start = r["start_date"]
-                        ek_end = r.get("end_date")
-
-                        is_same_attempt = False
-                        if ek_start and r_start and ek_start == r_start:
-                            is_same_attempt = True
-                        elif (
-                            r_status == "Completed"
-                            and ek_status == "Completed"
-                            and ek_end
-                            and r_end
+                # Only scan this book's records for a same-attempt match to update
+                candidates = (
+                    [] if is_duplicate else self._records_by_book.get(book["id"], [])
+                )
+                for r in candidates:
+                    ek_status = r["status"]
+                    ek_start = r["start_date"]
+                    ek_end = r.get("end_date")
+
+                    is_same_attempt = False
+                    if ek_start and r_start and ek_start == r_start:
+                        is_same_attempt = True
+                    elif (
+                        r_status == "Completed"
+                        and ek_status == "Completed"
+                        and ek_end
+                        and r_end
+                        and ek_end == r_end
+                    ):
+                        is_same_attempt = True
+                    elif ek_status == "In Progress":
+                        is_same_attempt = True
+
+                    if is_same_attempt:
+                        if (
+                            ek_status == r_status
+                            and ek_start == r_start
                             and ek_end == r_end
                         ):
-                            is_same_attempt = True
-                        elif ek_status == "In Progress":
-                            is_same_attempt = True
-
-                        if is_same_attempt:
-                            if (
-                                ek_status == r_status
-                                and ek_start == r_start
-                                and ek_end == r_end
-                            ):
-                                is_duplicate = True
-                            else:
-                                matched_record = r
-                            break
+                            is_duplicate = True
+                        else:
+                            matched_record = r
+                        break
 
                 if is_duplicate:
                     pass
                 elif matched_record:
                     old_status = matched_record.get("status")
+                    seen_records.discard(
+                        (
+                            matched_record["book_id"],
+                            old_status,
+                            matched_record["start_date"],
+                            matched_record.get("end_date"),
+                        )
+                    )
+                    seen_records.add(record_key)
                     matched_record.update(
                         {
                             "status": r_status,
@@ -424,6 +494,7 @@ class MockStorage:
                             or matched_record.get("rating", 0),
                         }
                     )
+                    self._search_text.pop(book["id"], None)
                     logger.info(
                         f"READING_RECORD_UPDATED (Mock bulk): id={matched_record['id']}, "
                         f"status_change='{old_status}'->'{r_status}'"
@@ -436,6 +507,7 @@ class MockStorage:
                         end_date=r_end,
                         rating=record_data.get("rating") or 0,
                     )
+                    seen_records.add(record_key)
             import_count += 1
         return import_count
 
@@ -445,48 +517,64 @@ class MockStorage:
         self.remove_from_reading_list(book_id)
 
         # 2. Add 'In Progress' record
-        from datetime import date
-
         self.add_reading_record(
             book_id=book_id, status="In Progress", start_date=date.today().isoformat()
         )
 
     def get_reading_history(self) -> list[dict[str, Any]]:
         """Retrieve all reading records joined with book metadata."""
-        history = []
-        book_map = {b["id"]: b for b in self.books}
         # Use get_reading_records to ensure consistency with GoogleSheetsStorage
         records = self.get_reading_records()
-        valid_statuses = ["In Progress", "Completed", "Abandoned"]
-        for record in records:
-            # The reading log view should not show books that are in 'Plan to read' status.
-            # The books in the reading log should be either in progress, completed or abandoned.
-            if record.get("status") not in valid_statuses:
-                continue
-
-            book = book_map.get(record["book_id"])
-            if book:
-                # Create a copy of the record and enrich it
-                enriched_record = record.copy()
-                enriched_record["book_title"] = book["title"]
-                enriched_record["book_author"] = book["author"]
-                enriched_record["book_authors"] = book.get("authors", [])
-                enriched_record["book_thumbnail_url"] = book.get("thumbnail_url")
-                history.append(enriched_record)
-        return history
-
-    def search(self, query: str) -> list[dict[str, Any]]:
+        # The reading log view should not show books that are in 'Plan to read' status.
+        # The books in the reading log should be either in progress, completed or abandoned.
+        valid_statuses = {"In Progress", "Completed", "Abandoned"}
+        book_map = self._books_by_id
+        return [
+            {
+                **record,
+                "book_title": book["title"],
+                "book_author": book["author"],
+                "book_authors": book.get("authors", []),
+                "book_thumbnail_url": book.get("thumbnail_url"),
+            }
+            for record in records
+            if record.get("status") in valid_statuses
+            and (book := book_map.get(record["book_id"])) is not None
+        ]
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[dict[str, Any]]:
         """Search across all book data fields.
 
         Args:
             query: Search query (free text).
+            limit: Return only this many of the most relevant books.
 
         Returns:
             List of matching books with reading_records attached, sorted by relevance.
         """
-        from book_lamp.services.search import search_books
+        needle = query.strip() if query else ""
+        if not needle:
+            return []
+        compiled = compile_query(needle)
 
-        return search_books(self.books, self.reading_records, query)
+        # Only score books whose cached text contains the query
+        candidates = []
+        for book in self.books:
+            text = self._search_text.get(book["id"])
+            if text is None:
+                text = searchable_text(book, self._records_by_book.get(book["id"], []))
+                self._search_text[book["id"]] = text
+            if may_contain(text, compiled):
+                candidates.append(book)
+
+        records = [
+            record
+            for book in candidates
+            for record in self._records_by_book.get(book["id"], [])
+        ]
+        return search_books(
+            candidates, records, query, limit=limit, search_texts=self._search_text
+        )
 
     def get_recommendations(self) -> list[dict[str, Any]]:
         """Return cached recommendations."""
@@ -4,109 +4,181 @@ This module provides search functionality across book and reading record fields.
 Supports free text search.
 """
 
+import functools
+import heapq
 import re
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Field weights (higher weight = more important match)
+_BOOK_FIELD_WEIGHTS = (
+    ("title", 10.0),
+    ("isbn13", 7.0),
+    ("series", 6.0),
+    ("publisher", 4.0),
+    ("description", 2.0),
+    ("bisac_category", 7.0),
+    ("publication_year", 3.0),
+    ("id", 10.0),  # strong match if user searches for specific ID
+    ("created_at", 1.0),
+)
+# Matched against both the legacy author field and individual authors
+_AUTHOR_WEIGHT = 8.0
+# Reading record fields
+_STATUS_WEIGHT = 5.0
+_RATING_WEIGHT = 4.0
+_DATES_WEIGHT = 3.0  # start_date and end_date
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """A search query prepared once for matching against many books."""
+
+    text: str
+    lower: str
+    is_ascii: bool
+    pattern: "re.Pattern[str]"
+
+
+@functools.lru_cache(maxsize=256)
+def compile_query(query: str) -> CompiledQuery:
+    """Prepare a query for case-insensitive literal matching.
+
+    The query is always escaped so it is treated as a literal string.
+    Results are cached, so repeated searches skip escaping and compiling.
+    """
+    return CompiledQuery(
+        text=query,
+        lower=query.lower(),
+        is_ascii=query.isascii(),
+        pattern=re.compile(re.escape(query), re.IGNORECASE),
+    )
 
 
 def calculate_relevance_score(
     book: Dict[str, Any],
     reading_records: List[Dict[str, Any]],
-    query: str,
+    query: Union[str, CompiledQuery],
 ) -> float:
     """Calculate relevance score for a book based on search query.
 
     Args:
         book: Book dictionary with fields to search.
         reading_records: List of reading records for this book.
-        query: Search query string.
+        query: Search query string, or one from compile_query to reuse
+            across books.
 
     Returns:
         Relevance score (higher is more relevant).
     """
     score = 0.0
 
-    # Field weights (higher weight = more important match)
-    weights = {
-        "title": 10.0,
-        "author": 8.0,
-        "isbn13": 7.0,
-        "series": 6.0,
-        "publisher": 4.0,
-        "description": 2.0,
-        "bisac_category": 7.0,
-        "publication_year": 3.0,
-        "id": 10.0,  # strong match if user searches for specific ID
-        "created_at": 1.0,
-        # Reading record fields
-        "status": 5.0,
-        "rating": 4.0,
-        "dates": 3.0,  # start_date and end_date
-    }
-
-    def matches(text: str, pattern: str) -> bool:
-        """Check if text matches the pattern."""
+    if isinstance(query, str):
+        query = compile_query(query)
+    pattern = query.pattern
+    query_lower = query.lower
+    query_ascii = query.is_ascii
+
+    def matches(text: str) -> bool:
+        """Check if text contains the query."""
         if not text:
             return False
-
         text_str = str(text)
-
-        # Always escape the pattern to treat it as a literal string.
-        search_pattern = re.escape(pattern)
-        return bool(re.search(search_pattern, text_str, re.IGNORECASE))
+        # For ASCII, lowercased substring search agrees with re.IGNORECASE
+        if query_ascii and text_str.isascii():
+            return query_lower in text_str.lower()
+        return pattern.search(text_str) is not None
 
     # Search book fields
-    for field, weight in weights.items():
-        if field in ["status", "rating", "dates"]:
-            continue  # These are in reading records
-
-        if field == "author":
-            # Search both the legacy field and individual authors
-            authors = book.get("authors", [])
-            legacy_author = book.get("author")
-
-            matches_found = False
-            if legacy_author and matches(str(legacy_author), query):
-                score += weight
-                matches_found = True
-
-            for author in authors:
-                if matches(str(author), query):
-                    score += weight
-                    matches_found = True
-
-            # Bonus for exact match on any author
-            if matches_found:
-                if any(str(a).lower() == query.lower() for a in authors) or (
-                    legacy_author and str(legacy_author).lower() == query.lower()
-                ):
-                    score += weight * 0.5
-            continue
-
+    for field, weight in _BOOK_FIELD_WEIGHTS:
         value = book.get(field)
-        if value and matches(str(value), query):
+        if value and matches(str(value)):
             score += weight
             # Bonus for exact match
-            if str(value).lower() == query.lower():
+            if str(value).lower() == query_lower:
                 score += weight * 0.5
 
+    # Search both the legacy author field and individual authors
+    authors = book.get("authors", [])
+    legacy_author = book.get("author")
+
+    matches_found = False
+    if legacy_author and matches(str(legacy_author)):
+        score += _AUTHOR_WEIGHT
+        matches_found = True
+
+    for author in authors:
+        if matches(str(author)):
+            score += _AUTHOR_WEIGHT
+            matches_found = True
+
+    # Bonus for exact match on any author
+    if matches_found:
+        if any(str(a).lower() == query_lower for a in authors) or (
+            legacy_author and str(legacy_author).lower() == query_lower
+        ):
+            score += _AUTHOR_WEIGHT * 0.5
+
     # Search reading record fields
     for record in reading_records:
-        if matches(record.get("status", ""), query):
-            score += weights["status"]
-        if record.get("rating") and matches(str(record["rating"]), query):
-            score += weights["rating"]
-        if matches(record.get("start_date", ""), query):
-            score += weights["dates"]
-        if matches(record.get("end_date", ""), query):
-            score += weights["dates"]
+        if matches(record.get("status", "")):
+            score += _STATUS_WEIGHT
+        if record.get("rating") and matches(str(record["rating"])):
+            score += _RATING_WEIGHT
+        if matches(record.get("start_date", "")):
+            score += _DATES_WEIGHT
+        if matches(record.get("end_date", "")):
+            score += _DATES_WEIGHT
 
     return score
 
 
+def searchable_text(
+    book: Dict[str, Any],
+    reading_records: List[Dict[str, Any]],
+) -> str:
+    """Build the lowercased text that any match for a book must occur in.
+
+    Covers every field scored by calculate_relevance_score, so a query absent
+    from this text cannot give the book a positive score.
+
+    Args:
+        book: Book dictionary with fields to search.
+        reading_records: List of reading records for this book.
+
+    Returns:
+        Field values joined by newlines, lowercased.
+    """
+    parts = [str(book[field]) for field, _ in _BOOK_FIELD_WEIGHTS if book.get(field)]
+    if book.get("author"):
+        parts.append(str(book["author"]))
+    parts.extend(str(author) for author in book.get("authors", []))
+    for record in reading_records:
+        for field in ("status", "rating", "start_date", "end_date"):
+            if record.get(field):
+                parts.append(str(record[field]))
+    return "\n".join(parts).lower()
+
+
+def may_contain(text: str, query: Union[str, CompiledQuery]) -> bool:
+    """Check whether lowercased text could contain a match for the query.
+
+    Only rules a match out where lowercased substring search is exact, i.e.
+    when both sides are ASCII; otherwise the caller must score the book.
+    """
+    if isinstance(query, str):
+        query = compile_query(query)
+    if query.is_ascii and text.isascii():
+        return query.lower in text
+    return True
+
+
 def search_books(
     all_books: List[Dict[str, Any]],
     all_records: List[Dict[str, Any]],
     query: str,
+    limit: Optional[int] = None,
+    search_texts: Optional[Dict[Any, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Search across all book data fields.
 
@@ -114,6 +186,8 @@ def search_books(
         all_books: List of all books.
         all_records: List of all reading records.
         query: Search query (free text).
+        limit: Return only this many of the most relevant books.
+        search_texts: Already built searchable_text values by book ID.
 
     Returns:
         List of matching books with reading_records attached, sorted by relevance.
@@ -121,22 +195,43 @@ def search_books(
     if not query or not query.strip():
         return []
 
-    query = query.strip()
+    compiled = compile_query(query.strip())
 
-    # Attach reading records to books and calculate scores
-    results = []
-    for book in all_books:
-        book_records = [r for r in all_records if r["book_id"] == book["id"]]
-        score = calculate_relevance_score(book, book_records, query)
+    # Group records by book once rather than filtering them for every book
+    records_by_book: Dict[Any, List[Dict[str, Any]]] = {}
+    for record in all_records:
+        records_by_book.setdefault(record["book_id"], []).append(record)
 
+    # Score books, copying only those that end up in the results
+    scored = []
+    for book in all_books:
+        book_records = records_by_book.get(book["id"], [])
+        # Cheap single substring test before the per-field scoring
+        text = search_texts.get(book["id"]) if search_texts else None
+        if text is None:
+            text = searchable_text(book, book_records)
+        if not may_contain(text, compiled):
+            continue
+        score = calculate_relevance_score(book, book_records, compiled)
         if score > 0:
-            # Create a copy to avoid mutating the original
-            book_copy = book.copy()
-            book_copy["reading_records"] = book_records
-            book_copy["_relevance_score"] = score
-            results.append(book_copy)
-
-    # Sort by relevance score (descending)
-    results.sort(key=lambda b: b["_relevance_score"], reverse=True)
+            scored.append((score, book, book_records))
+
+    def by_score(item: Tuple[float, Dict[str, Any], List[Dict[str, Any]]]) -> float:
+        return item[0]
+
+    if limit is not None:
+        # Partial selection; ties keep their original order like the sort
+        scored = heapq.nlargest(limit, scored, key=by_score)
+    else:
+        # Sort by relevance score (descending)
+        scored.sort(key=by_score, reverse=True)
+
+    results = []
+    for score, book, book_records in scored:
+        # Create a copy to avoid mutating the original
+        book_copy = book.copy()
+        book_copy["reading_records"] = book_records
+        book_copy["_relevance_score"] = score
+        results.append(book_copy)
 
     return results
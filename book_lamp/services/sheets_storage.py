@@ -2,15 +2,22 @@
 
 import logging
 import os
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from google.oauth2.credentials import Credentials  # type: ignore
+from google_auth_httplib2 import AuthorizedHttp  # type: ignore
 from googleapiclient.discovery import build  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
+from googleapiclient.http import HttpRequest, build_http  # type: ignore
 
 from book_lamp.services.cache import get_cache
+from book_lamp.services.search import search_books
+from book_lamp.utils.authors import split_authors
+from book_lamp.utils.books import normalize_isbn
 
 # We request the Drive file scope to allow searching for and managing the specific
 # spreadsheet created by this app. The Drive scope is limited to files
@@ -22,9 +29,87 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.file",
 ]
 
+FOLDER_MIME = "application/vnd.google-apps.folder"
+SPREADSHEET_MIME = "application/vnd.google-apps.spreadsheet"
+
 logger = logging.getLogger(__name__)
 
 
+def _drive_literal(value: str) -> str:
+    """Quote a value as a Drive query string literal."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _names_clause(names: List[str]) -> str:
+    """Build a Drive query clause matching any of the given file names."""
+    return " or ".join(f"name = {_drive_literal(n)}" for n in dict.fromkeys(names))
+
+
+def _cell(value: Any) -> Dict[str, Any]:
+    """Convert a row value to CellData, matching a RAW values write."""
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
+def _row_data(rows: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Convert rows of values to RowData for batchUpdate cell requests."""
+    return [{"values": [_cell(value) for value in row]} for row in rows]
+
+
+def _coalesce_rows(
+    updates: List[Tuple[int, List[Any]]],
+) -> List[Tuple[int, List[List[Any]]]]:
+    """Group (row number, row) updates into runs of consecutive rows.
+
+    Returns (first row number, rows) per run. Repeated row numbers start a
+    new run after the earlier one, so the later write still wins.
+    """
+    runs: List[Tuple[int, List[List[Any]]]] = []
+    for number, row in sorted(updates, key=lambda update: update[0]):
+        if runs and runs[-1][0] + len(runs[-1][1]) == number:
+            runs[-1][1].append(row)
+        else:
+            runs.append((number, [row]))
+    return runs
+
+
+# Retries for rate-limited (429) and server-error (5xx) responses; the client
+# backs off exponentially with jitter between attempts
+API_RETRIES = 4
+
+
+class _RetryingHttpRequest(HttpRequest):
+    """API request that retries transient read failures unless told otherwise.
+
+    Only GETs are retried. A write that timed out may still have been
+    applied, and repeating an append or row delete would duplicate rows or
+    remove the wrong one.
+    """
+
+    def execute(self, http: Any = None, num_retries: Optional[int] = None) -> Any:
+        if num_retries is None:
+            num_retries = API_RETRIES if self.method == "GET" else 0
+        return super().execute(http=http, num_retries=num_retries)
+
+
+# httplib2 keeps connections alive but is not thread-safe, so each thread
+# keeps one Http that every storage instance created on it reuses
+_thread_http = threading.local()
+
+
+def _shared_http() -> Any:
+    """Return this thread's keep-alive HTTP client, creating it on first use."""
+    http = getattr(_thread_http, "http", None)
+    if http is None:
+        http = _thread_http.http = build_http()
+    return http
+
+
 def _sanitize_for_sheets(value: Any) -> str:
     """Convert any value to a string safe for Google Sheets.
 
@@ -46,6 +131,46 @@ def _sanitize_for_sheets(value: Any) -> str:
     return ""
 
 
+# Seconds a modifiedTime read is trusted by later instances in this process,
+# so a burst of requests costs one Drive call rather than one each
+MODIFIED_CHECK_WINDOW = 5.0
+
+# Spreadsheet ID -> (monotonic time read, modifiedTime)
+_recent_modified: Dict[str, Tuple[float, str]] = {}
+
+
+# Tabs whose contents make up the parsed books
+_BOOK_TABS = frozenset({"Books", "Authors", "BookAuthors"})
+
+# Number of Books columns the row parser knows about (id .. cover_url)
+_BOOK_ROW_WIDTH = 18
+
+
+def _parse_count(value: Any) -> Optional[int]:
+    """Parse a whole-number cell such as "2001" or "320.0"; None if blank."""
+    if value and str(value).replace(".", "").isdigit():
+        return int(float(value))
+    return None
+
+
+def _parse_id(value: Any) -> Optional[int]:
+    """Parse an ID cell, accepting "1" or "1.0"; None if it isn't numeric."""
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _highest_id(cells: Iterable[Any]) -> int:
+    """Return the largest ID among the cells, or 0 if none parse."""
+    return max(
+        (row_id for cell in cells if (row_id := _parse_id(cell)) is not None),
+        default=0,
+    )
+
+
 class GoogleSheetsStorage:
     """Adapter for storing book data in Google Sheets.
 
@@ -72,9 +197,22 @@ class GoogleSheetsStorage:
         self.sheet_name = sheet_name
         self.spreadsheet_id = spreadsheet_id
         self.credentials_dict = credentials_dict
+        self._creds: Optional[Credentials] = None
         self.service = None
         self.drive_service = None
         self._cache: Dict[str, List[List[Any]]] = {}
+        # Parsed books and lookups, rebuilt whenever the raw tab cache changes
+        self._books_cache: Optional[List[Dict[str, Any]]] = None
+        self._books_by_id: Dict[int, Dict[str, Any]] = {}
+        self._books_by_isbn: Dict[str, Dict[str, Any]] = {}
+        # Tab sheet IDs per spreadsheet; they never change once a tab exists
+        self._sheet_ids: Dict[tuple[str, str], int] = {}
+        # Next free ID per tab, read once and then advanced locally
+        self._next_ids: Dict[tuple[str, str], int] = {}
+        # Whether the persistent tab cache was checked against Drive yet
+        self._cache_validated = False
+        # Sheet row number per book ID; only deleting a book moves rows
+        self._book_rows: Dict[int, int] = {}
 
     def _connect(self) -> None:
         """Establish connection to the Google Sheets and Drive APIs."""
@@ -85,12 +223,27 @@ class GoogleSheetsStorage:
         start_time = datetime.now()
         creds = self.load_credentials()
         if creds and creds.valid:
-            # Building service objects can be slow as it fetches
-            # large discovery documents from the internet.
-            # We parallelize these calls to save 1-2 seconds.
+            # Building service objects can be slow as it parses large
+            # discovery documents, so we build both in parallel. They share
+            # one authorised client so API calls reuse this thread's open
+            # connections across storage instances; building issues no
+            # requests, so the pool threads may share it.
+            http = AuthorizedHttp(creds, http=_shared_http())
             with ThreadPoolExecutor(max_workers=2) as executor:
-                f_sheets = executor.submit(build, "sheets", "v4", credentials=creds)
-                f_drive = executor.submit(build, "drive", "v3", credentials=creds)
+                f_sheets = executor.submit(
+                    build,
+                    "sheets",
+                    "v4",
+                    http=http,
+                    requestBuilder=_RetryingHttpRequest,
+                )
+                f_drive = executor.submit(
+                    build,
+                    "drive",
+                    "v3",
+                    http=http,
+                    requestBuilder=_RetryingHttpRequest,
+                )
                 self.service = f_sheets.result()
                 self.drive_service = f_drive.result()
 
@@ -103,7 +256,11 @@ class GoogleSheetsStorage:
         """Load credentials from the internal dictionary.
 
         Client ID and secret are injected from environment variables if not present.
+        Valid credentials are kept for the life of the instance, so the
+        authorisation check and the API connection share one parse.
         """
+        if self._creds is not None and self._creds.valid:
+            return self._creds
         if not self.credentials_dict:
             return None
 
@@ -117,7 +274,9 @@ class GoogleSheetsStorage:
             if not token_data.get("client_secret"):
                 token_data["client_secret"] = os.environ.get("GOOGLE_CLIENT_SECRET")
 
-            creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+            creds: Credentials = Credentials.from_authorized_user_info(
+                token_data, SCOPES
+            )
 
             # If expired, we let google-auth handle the refresh automatically
             # when requests are made, provided we have a refresh token.
@@ -125,7 +284,10 @@ class GoogleSheetsStorage:
             # to propagate changes back to the session yet.
             # Ideally, we would update the session if the token updates.
 
-            return creds if creds and creds.valid else None
+            if creds and creds.valid:
+                self._creds = creds
+                return creds
+            return None
         except (ValueError, KeyError):
             return None
 
@@ -134,43 +296,73 @@ class GoogleSheetsStorage:
         creds = self.load_credentials()
         return creds is not None and creds.valid
 
-    def _get_or_create_folder_path(self, path: str) -> str:
+    def _list_drive_files(self, query: str) -> List[Dict[str, Any]]:
+        """List non-trashed Drive files matching a query, with their parents."""
+        assert self.drive_service is not None
+        results = (
+            self.drive_service.files()
+            .list(
+                q=f"({query}) and trashed = false",
+                spaces="drive",
+                fields="files(id, name, mimeType, parents)",
+            )
+            .execute()
+        )
+        return results.get("files", [])
+
+    def _get_or_create_folder_path(
+        self, path: str, folders: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """Get or create a folder hierarchy in Google Drive.
 
         Args:
             path: Forward-slash separated path, e.g. 'AppData/BookLamp'.
+            folders: Folders already listed by the caller; fetched if omitted.
 
         Returns:
             The ID of the final folder in the path.
         """
         assert self.drive_service is not None
         parts = path.split("/")
+
+        # Fetch every folder named in the path with one query, then link them
+        # up in memory. The drive.file scope only exposes folders this app
+        # created, and it only ever creates the first component at the root,
+        # so that component is matched by name alone.
+        if folders is None:
+            folders = self._list_drive_files(
+                f"({_names_clause(parts)}) and mimeType = '{FOLDER_MIME}'"
+            )
+
         parent_id = "root"
+        for depth, part in enumerate(parts):
+            match = next(
+                (
+                    f
+                    for f in folders
+                    if f["name"] == part
+                    and (depth == 0 or parent_id in f.get("parents", []))
+                ),
+                None,
+            )
+            if match:
+                parent_id = match["id"]
+                continue
 
-        for part in parts:
-            query = f"name = '{part}' and '{parent_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-            results = (
+            # Create the folder
+            file_metadata = {
+                "name": part,
+                "mimeType": FOLDER_MIME,
+                "parents": [parent_id],
+            }
+            file = (
                 self.drive_service.files()
-                .list(q=query, spaces="drive", fields="files(id, name)")
+                .create(body=file_metadata, fields="id")
                 .execute()
             )
-            files = results.get("files", [])
-
-            if files:
-                parent_id = files[0]["id"]
-            else:
-                # Create the folder
-                file_metadata = {
-                    "name": part,
-                    "mimeType": "application/vnd.google-apps.folder",
-                    "parents": [parent_id],
-                }
-                file = (
-                    self.drive_service.files()
-                    .create(body=file_metadata, fields="id")
-                    .execute()
-                )
-                parent_id = file.get("id")
+            parent_id = file.get("id")
+            # Anything deeper cannot exist under a folder we just created
+            folders = []
 
         return parent_id
 
@@ -185,20 +377,25 @@ class GoogleSheetsStorage:
         if not self.drive_service or not self.service:
             raise Exception("Not authorised. Please log in via the web interface.")
 
-        # Find or create AppData/BookLamp folder
-        folder_id = self._get_or_create_folder_path("AppData/BookLamp")
-
-        # Find the sheet in that folder
-        query = (
-            f"name = '{self.sheet_name}' and '{folder_id}' in parents and "
-            f"mimeType = 'application/vnd.google-apps.spreadsheet' and trashed = false"
+        # List the AppData/BookLamp folders and candidate sheets in one
+        # query; the sheet is picked once the folder ID is known
+        folder_path = "AppData/BookLamp"
+        found = self._list_drive_files(
+            f"(({_names_clause(folder_path.split('/'))}) "
+            f"and mimeType = '{FOLDER_MIME}') or "
+            f"(name = {_drive_literal(self.sheet_name)} "
+            f"and mimeType = '{SPREADSHEET_MIME}')"
         )
-        results = (
-            self.drive_service.files()
-            .list(q=query, spaces="drive", fields="files(id, name)")
-            .execute()
+        folder_id = self._get_or_create_folder_path(
+            folder_path,
+            folders=[f for f in found if f.get("mimeType") == FOLDER_MIME],
         )
-        files = results.get("files", [])
+        files = [
+            f
+            for f in found
+            if f.get("mimeType") == SPREADSHEET_MIME
+            and folder_id in f.get("parents", [])
+        ]
 
         if files:
             self.spreadsheet_id = files[0]["id"]
@@ -206,7 +403,7 @@ class GoogleSheetsStorage:
             # Create the sheet
             file_metadata = {
                 "name": self.sheet_name,
-                "mimeType": "application/vnd.google-apps.spreadsheet",
+                "mimeType": SPREADSHEET_MIME,
                 "parents": [folder_id],
             }
             file = (
@@ -221,11 +418,75 @@ class GoogleSheetsStorage:
 
         return self.spreadsheet_id
 
-    def _clear_persistent_cache(self) -> None:
-        """Clear the persistent cache for this spreadsheet."""
+    def _clear_persistent_cache(self, *tabs: str) -> None:
+        """Clear the persistent cache for this spreadsheet after a write.
+
+        In memory only the named tabs are dropped (every tab if none are
+        named), so a request that writes one tab keeps the others it read.
+        """
         if self.spreadsheet_id:
             get_cache().delete(f"sheets_data:{self.spreadsheet_id}")
-        self._cache.clear()
+            get_cache().delete(f"sheets_modified:{self.spreadsheet_id}")
+            _recent_modified.pop(self.spreadsheet_id, None)
+        if not tabs:
+            self._cache.clear()
+            self._books_cache = None
+            return
+        for tab in tabs:
+            self._cache.pop(tab, None)
+        if _BOOK_TABS.intersection(tabs):
+            self._books_cache = None
+
+    def _get_modified_time(self, sid: str) -> Optional[str]:
+        """Fetch the spreadsheet's Drive modifiedTime, or None if unavailable."""
+        if not self.drive_service:
+            return None
+        try:
+            result = (
+                self.drive_service.files()
+                .get(fileId=sid, fields="modifiedTime")
+                .execute()
+            )
+        except HttpError as error:
+            logger.warning(f"Could not read modifiedTime for {sid}: {error}")
+            return None
+        modified = result.get("modifiedTime")
+        if modified:
+            _recent_modified[sid] = (time.monotonic(), modified)
+        return modified
+
+    def _recent_modified_time(self, sid: str) -> Optional[str]:
+        """Return a modifiedTime read within the last few seconds, else fetch it."""
+        recent = _recent_modified.get(sid)
+        if recent and time.monotonic() - recent[0] < MODIFIED_CHECK_WINDOW:
+            return recent[1]
+        return self._get_modified_time(sid)
+
+    def _load_cached_tabs(self, sid: str) -> Optional[Dict[str, List[List[Any]]]]:
+        """Return persistently cached tab values if the spreadsheet is unchanged.
+
+        The Drive modifiedTime recorded at fetch time is compared once per
+        instance, so edits made outside the app are seen within a few seconds
+        rather than when the entry expires.
+        """
+        cache = get_cache()
+        cached = cache.get(f"sheets_data:{sid}")
+        if not isinstance(cached, dict):
+            return None
+        if not self._cache_validated:
+            recorded = cache.get(f"sheets_modified:{sid}")
+            if recorded is None or recorded != self._recent_modified_time(sid):
+                logger.debug(f"Cached data for {sid} is out of date")
+                cache.delete(f"sheets_data:{sid}")
+                return None
+            self._cache_validated = True
+        return cached
+
+    def _store_values(self, data: Dict[str, List[List[Any]]]) -> None:
+        """Merge fetched tab values into the in-memory cache."""
+        self._cache.update(data)
+        if _BOOK_TABS.intersection(data):
+            self._books_cache = None
 
     def prefetch(self, force: bool = False) -> None:
         """Fetch all primary data tabs in a single batch call to improve performance.
@@ -240,10 +501,10 @@ class GoogleSheetsStorage:
         cache = get_cache()
         cache_key = f"sheets_data:{sid}"
         if not force:
-            cached = cache.get(cache_key)
+            cached = self._load_cached_tabs(sid)
             if cached:
                 logger.debug(f"Prefetch cache hit for {sid}")
-                self._cache.update(cached)
+                self._store_values(cached)
                 return
 
         # Define the ranges we want to fetch
@@ -259,11 +520,15 @@ class GoogleSheetsStorage:
         ranges = [f"{tab}!A:P" for tab in tabs if tab != "Settings"] + ["Settings!A:B"]
 
         try:
+            # Read before the values so a concurrent edit invalidates them
+            modified = self._get_modified_time(sid)
             logger.info(f"Prefetching data from Google Sheets API for {sid}")
             result = (
                 self.service.spreadsheets()
                 .values()
-                .batchGet(spreadsheetId=sid, ranges=ranges)
+                .batchGet(
+                    spreadsheetId=sid, ranges=ranges, fields="valueRanges(values)"
+                )
                 .execute()
             )
             value_ranges = result.get("valueRanges", [])
@@ -272,9 +537,13 @@ class GoogleSheetsStorage:
                 if i < len(tabs):
                     new_cache_data[tabs[i]] = vr.get("values", [])
 
-            self._cache.update(new_cache_data)
-            # Store in persistent cache for 15 minutes
-            cache.set(cache_key, self._cache, ttl=900)
+            self._store_values(new_cache_data)
+            # Store in persistent cache; modifiedTime keeps it honest, the
+            # TTL only bounds how long an unused entry lingers
+            cache.set(cache_key, self._cache, ttl=86400)
+            if modified:
+                cache.set(f"sheets_modified:{sid}", modified, ttl=86400)
+            self._cache_validated = True
         except HttpError as error:
             if error.resp.status == 400:
                 # One of the tabs might be missing, initialize and don't cache yet
@@ -290,11 +559,9 @@ class GoogleSheetsStorage:
         sid = self._ensure_spreadsheet_id()
 
         # Check persistent cache
-        cache = get_cache()
-        cache_key = f"sheets_data:{sid}"
-        cached = cache.get(cache_key)
-        if isinstance(cached, dict) and tab_name in cached:
-            self._cache.update(cached)
+        cached = self._load_cached_tabs(sid)
+        if cached and tab_name in cached:
+            self._store_values(cached)
             return self._cache[tab_name]
 
         assert self.service is not None
@@ -302,11 +569,11 @@ class GoogleSheetsStorage:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range=range_def)
+                .get(spreadsheetId=sid, range=range_def, fields="values")
                 .execute()
             )
             values = result.get("values", [])
-            self._cache[tab_name] = values
+            self._store_values({tab_name: values})
             return values
         except HttpError as error:
             if error.resp.status == 400:
@@ -314,36 +581,95 @@ class GoogleSheetsStorage:
                 return []
             raise
 
+    def _fetch_tabs(
+        self, sid: str, ranges: Dict[str, str]
+    ) -> Dict[str, List[List[Any]]]:
+        """Fetch several tab ranges in one batchGet, keyed by tab name.
+
+        If a tab is missing the whole request is rejected, so the sheets are
+        initialised and the fetch is retried once.
+        """
+        assert self.service is not None
+
+        def batch_get() -> Dict[str, Any]:
+            assert self.service is not None
+            return (
+                self.service.spreadsheets()
+                .values()
+                .batchGet(
+                    spreadsheetId=sid,
+                    ranges=list(ranges.values()),
+                    fields="valueRanges(values)",
+                )
+                .execute()
+            )
+
+        try:
+            result = batch_get()
+        except HttpError as error:
+            if error.resp.status != 400:
+                raise
+            self.initialize_sheets()
+            result = batch_get()
+        return {
+            tab: vr.get("values", [])
+            for tab, vr in zip(ranges, result.get("valueRanges", []))
+        }
+
+    def _load_tabs(self, ranges: Dict[str, str]) -> None:
+        """Bring tabs into the in-memory cache, fetching any missing together."""
+        missing = {tab: r for tab, r in ranges.items() if tab not in self._cache}
+        if not missing:
+            return
+        sid = self._ensure_spreadsheet_id()
+        cached = self._load_cached_tabs(sid)
+        if cached and all(tab in cached for tab in missing):
+            self._store_values(cached)
+            return
+        self._store_values(self._fetch_tabs(sid, missing))
+
     def _get_next_id(self, tab_name: str) -> int:
-        """Get the next available ID for a tab."""
+        """Get the next available ID for a tab.
+
+        The counter is seeded from the tab's rows if they are already in
+        memory, otherwise from a read of the ID column; later calls on this
+        instance hand out IDs locally. Instances live for a single request or
+        sync operation, so the counter cannot go stale for long.
+        """
         sid = self._ensure_spreadsheet_id()
+        key = (sid, tab_name)
+        if key not in self._next_ids:
+            self._next_ids[key] = self._max_id(sid, tab_name) + 1
+        next_id = self._next_ids[key]
+        self._next_ids[key] = next_id + 1
+        return next_id
+
+    def _max_id(self, sid: str, tab_name: str) -> int:
+        """Return the highest ID in a tab, or 0 if it has none."""
+        if tab_name in self._cache:
+            return _highest_id(row[0] for row in self._cache[tab_name] if row)
+
         assert self.service is not None
         try:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range=f"{tab_name}!A:A")
+                .get(
+                    spreadsheetId=sid,
+                    range=f"{tab_name}!A2:A",
+                    majorDimension="COLUMNS",
+                    fields="values",
+                )
                 .execute()
             )
-            values = result.get("values", [])
-            if len(values) <= 1:  # Only header or empty
-                return 1
-            # Find max ID (skip header)
-            ids = []
-            for row in values[1:]:
-                if not row or not row[0]:
-                    continue
-                try:
-                    # Handle "1" or "1.0"
-                    val = float(row[0])
-                    ids.append(int(val))
-                except (ValueError, TypeError):
-                    continue
-            return max(ids) + 1 if ids else 1
         except HttpError as error:
             if error.resp.status == 400:
                 self.initialize_sheets()
-            return 1
+            return 0
+
+        # Column-major: the whole ID column comes back as one flat list
+        column = next(iter(result.get("values", [])), [])
+        return _highest_id(column)
 
     def get_authors(self) -> List[Dict[str, Any]]:
         """Retrieve all authors from the Authors tab."""
@@ -388,13 +714,12 @@ class GoogleSheetsStorage:
     def _sync_book_authors(self, sid: str, book_id: int, author_str: str) -> None:
         """Sync Authors and BookAuthors tabs based on an author string."""
         assert self.service is not None
-        from book_lamp.utils.authors import split_authors
-
         names = split_authors(author_str)
         if not names:
             return
 
-        # 1. Fetch existing authors
+        # 1. Fetch existing authors and links together
+        self._load_tabs({"Authors": "Authors!A:B", "BookAuthors": "BookAuthors!A:B"})
         all_authors = self.get_authors()
         name_to_id = {a["name"]: a["id"] for a in all_authors}
         max_aid = max([a["id"] for a in all_authors] + [0])
@@ -411,27 +736,7 @@ class GoogleSheetsStorage:
                 author_ids.append(max_aid)
                 name_to_id[name] = max_aid
 
-        if new_authors:
-            try:
-                self.service.spreadsheets().values().append(
-                    spreadsheetId=sid,
-                    range="Authors!A1",
-                    valueInputOption="RAW",
-                    body={"values": new_authors},
-                ).execute()
-            except HttpError as error:
-                if error.resp.status == 400:
-                    self.initialize_sheets()
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="Authors!A1",
-                        valueInputOption="RAW",
-                        body={"values": new_authors},
-                    ).execute()
-                else:
-                    raise
-
-        # 3. Update BookAuthors links
+        # 3. Add new authors and missing links together
         all_links = self.get_book_authors()
         existing_aids = {
             link["author_id"] for link in all_links if link["book_id"] == book_id
@@ -440,109 +745,132 @@ class GoogleSheetsStorage:
             [book_id, aid] for aid in author_ids if aid not in existing_aids
         ]
 
-        if links_to_add:
-            try:
-                self.service.spreadsheets().values().append(
-                    spreadsheetId=sid,
-                    range="BookAuthors!A1",
-                    valueInputOption="RAW",
-                    body={"values": links_to_add},
-                ).execute()
-            except HttpError as error:
-                if error.resp.status == 400:
-                    self.initialize_sheets()
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="BookAuthors!A1",
-                        valueInputOption="RAW",
-                        body={"values": links_to_add},
-                    ).execute()
-                else:
-                    raise
+        def build_requests() -> List[Dict[str, Any]]:
+            requests = []
+            if new_authors:
+                requests.append(self._append_rows_request("Authors", new_authors))
+            if links_to_add:
+                requests.append(self._append_rows_request("BookAuthors", links_to_add))
+            return requests
+
+        self._send_row_requests(sid, build_requests)
+
+    @staticmethod
+    def _parse_book_row(row: List[Any], width: int) -> Optional[Dict[str, Any]]:
+        """Parse a Books row into a book, or None if it isn't a valid book.
+
+        Args:
+            row: Raw cell values for the row.
+            width: Number of header columns, used to pad short rows.
+        """
+        if not row or len(row) < 3 or not row[0] or not row[2]:
+            # Skip empty rows or rows without ID or Title
+            return None
+        # Pad to the header with blanks; columns beyond the header read as None
+        row = row + [""] * (width - len(row))
+        if len(row) < _BOOK_ROW_WIDTH:
+            row = row + [None] * (_BOOK_ROW_WIDTH - len(row))
+        (
+            raw_id,
+            isbn13,
+            title,
+            author,
+            raw_year,
+            thumbnail_url,
+            created_at,
+            publisher,
+            description,
+            series,
+            bisac_category,
+            bisac_main_category,
+            bisac_sub_category,
+            language,
+            _,
+            physical_format,
+            edition,
+            cover_url,
+        ) = row[:_BOOK_ROW_WIDTH]
+        try:
+            # Handle potential float IDs like "1.0"
+            book_id = int(float(raw_id))
+            pub_year = _parse_count(raw_year)
+            # page_count has always been parsed from column M, not O
+            page_count = _parse_count(bisac_sub_category)
+        except (ValueError, TypeError):
+            return None
+
+        return {
+            "id": book_id,
+            "isbn13": isbn13,
+            "title": title,
+            "author": author,
+            "publication_year": pub_year,
+            "thumbnail_url": thumbnail_url or None,
+            "created_at": created_at or None,
+            "publisher": publisher,
+            "description": description,
+            "series": series,
+            "bisac_category": bisac_category,
+            "bisac_main_category": bisac_main_category,
+            "bisac_sub_category": bisac_sub_category,
+            "language": language,
+            "page_count": page_count,
+            "physical_format": physical_format,
+            "edition": edition,
+            "cover_url": cover_url or None,
+        }
+
+    def _attach_authors(self, books: List[Dict[str, Any]]) -> None:
+        """Set each book's authors from BookAuthors, or its legacy author string."""
+        # Fetch authors and links to join
+        authors_list = self.get_authors()
+        author_map = {a["id"]: a["name"] for a in authors_list}
+        links = self.get_book_authors()
+
+        # Map book_id to list of author names
+        book_authors_map: dict[int, list[str]] = {}
+        for link in links:
+            bid = link["book_id"]
+            aid = link["author_id"]
+            if aid in author_map:
+                book_authors_map.setdefault(bid, []).append(author_map[aid])
+
+        for b in books:
+            # If we have individual authors in BookAuthors, use them.
+            # Otherwise, split the legacy 'author' string.
+            if b["id"] in book_authors_map:
+                b["authors"] = book_authors_map[b["id"]]
+            else:
+                b["authors"] = split_authors(b["author"])
 
     def get_all_books(self) -> List[Dict[str, Any]]:
         """Retrieve all books from the Books tab."""
+        if self._books_cache is not None:
+            # Copies, so callers annotating books don't alter the cache
+            return [dict(b) for b in self._books_cache]
         try:
+            # Books and the author tabs joined onto them, in one round trip
+            self._load_tabs(
+                {
+                    "Books": "Books!A:P",
+                    "Authors": "Authors!A:B",
+                    "BookAuthors": "BookAuthors!A:B",
+                }
+            )
             values = self._get_values("Books", "Books!A:P")
             if not values or len(values) < 2:
                 return []
 
-            headers = values[0]
-            books_raw = []
-            for row in values[1:]:
-                if not row or len(row) < 3 or not row[0] or not row[2]:
-                    # Skip empty rows or rows without ID or Title
-                    continue
-                # Pad row to match header length (now 16 columns)
-                row = row + [""] * (len(headers) - len(row))
-                try:
-                    # Handle potential float IDs like "1.0"
-                    book_id = int(float(row[0]))
-                    pub_year = (
-                        int(float(row[4]))
-                        if row[4] and str(row[4]).replace(".", "").isdigit()
-                        else None
-                    )
-                    page_count = (
-                        int(float(row[12]))
-                        if len(row) > 12
-                        and row[12]
-                        and str(row[12]).replace(".", "").isdigit()
-                        else None
-                    )
-                except (ValueError, TypeError):
-                    continue
-
-                book = {
-                    "id": book_id,
-                    "isbn13": row[1],
-                    "title": row[2],
-                    "author": row[3],
-                    "publication_year": pub_year,
-                    "thumbnail_url": row[5] if row[5] else None,
-                    "created_at": row[6] if row[6] else None,
-                    "publisher": row[7] if len(row) > 7 else None,
-                    "description": row[8] if len(row) > 8 else None,
-                    "series": row[9] if len(row) > 9 else None,
-                    "bisac_category": row[10] if len(row) > 10 else None,
-                    "bisac_main_category": row[11] if len(row) > 11 else None,
-                    "bisac_sub_category": row[12] if len(row) > 12 else None,
-                    "language": row[13] if len(row) > 13 else None,
-                    "page_count": page_count,
-                    "physical_format": row[15] if len(row) > 15 else None,
-                    "edition": row[16] if len(row) > 16 else None,
-                    "cover_url": row[17] if len(row) > 17 and row[17] else None,
-                }
-                books_raw.append(book)
-
-            # Fetch authors and links to join
-            authors_list = self.get_authors()
-            author_map = {a["id"]: a["name"] for a in authors_list}
-            links = self.get_book_authors()
-
-            # Map book_id to list of author names
-            book_authors_map: dict[int, list[str]] = {}
-            for link in links:
-                bid = link["book_id"]
-                aid = link["author_id"]
-                if aid in author_map:
-                    if bid not in book_authors_map:
-                        book_authors_map[bid] = []
-                    book_authors_map[bid].append(author_map[aid])
-
-            from book_lamp.utils.authors import split_authors
-
-            final_books = []
-            for b in books_raw:
-                # If we have individual authors in BookAuthors, use them.
-                # Otherwise, split the legacy 'author' string.
-                if b["id"] in book_authors_map:
-                    b["authors"] = book_authors_map[b["id"]]
-                else:
-                    b["authors"] = split_authors(b["author"])
-                final_books.append(b)
+            self._remember_book_rows(values)
+            width = len(values[0])
+            parse = self._parse_book_row
+            final_books = [
+                book for row in values[1:] if (book := parse(row, width)) is not None
+            ]
+            self._attach_authors(final_books)
 
-            return final_books
+            self._cache_books(final_books)
+            return [dict(b) for b in final_books]
         except HttpError as error:
             if error.resp.status == 400:
                 self.initialize_sheets()
@@ -567,27 +895,25 @@ class GoogleSheetsStorage:
                 # Pad row to match header length
                 row = row + [""] * (len(headers) - len(row))
                 try:
-                    record_id = int(float(row[0]))
                     book_id_val = int(float(row[1]))
-                    rating = (
-                        int(float(row[5]))
-                        if row[5] and str(row[5]).replace(".", "").isdigit()
-                        else 0
-                    )
+                    if book_id is not None and book_id_val != book_id:
+                        continue
+                    record_id = int(float(row[0]))
+                    rating = _parse_count(row[5]) or 0
                 except (ValueError, TypeError):
                     continue
 
-                record = {
-                    "id": record_id,
-                    "book_id": book_id_val,
-                    "status": row[2],
-                    "start_date": row[3],
-                    "end_date": row[4] if row[4] else None,
-                    "rating": rating,
-                    "created_at": row[6] if row[6] else None,
-                }
-                if book_id is None or record["book_id"] == book_id:
-                    records.append(record)
+                records.append(
+                    {
+                        "id": record_id,
+                        "book_id": book_id_val,
+                        "status": row[2],
+                        "start_date": row[3],
+                        "end_date": row[4] if row[4] else None,
+                        "rating": rating,
+                        "created_at": row[6] if row[6] else None,
+                    }
+                )
 
             return records
         except HttpError as error:
@@ -677,7 +1003,7 @@ class GoogleSheetsStorage:
             )
             raise
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingList")
 
     def remove_from_reading_list(self, book_id: int) -> None:
         sid = self._ensure_spreadsheet_id()
@@ -686,7 +1012,7 @@ class GoogleSheetsStorage:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range="ReadingList!A:C")
+                .get(spreadsheetId=sid, range="ReadingList!A:C", fields="values")
                 .execute()
             )
             values = result.get("values", [])
@@ -719,7 +1045,7 @@ class GoogleSheetsStorage:
         except HttpError:
             pass
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingList")
 
     def update_reading_list_order(self, book_ids: List[int]) -> None:
         sid = self._ensure_spreadsheet_id()
@@ -728,7 +1054,7 @@ class GoogleSheetsStorage:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range="ReadingList!A:C")
+                .get(spreadsheetId=sid, range="ReadingList!A:C", fields="values")
                 .execute()
             )
             values = result.get("values", [])
@@ -764,7 +1090,7 @@ class GoogleSheetsStorage:
         except HttpError:
             pass
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingList")
 
     def get_recommendations(self) -> List[Dict[str, Any]]:
         """Retrieve cached AI recommendations from the Recommendations tab."""
@@ -842,7 +1168,7 @@ class GoogleSheetsStorage:
                 logger.error(f"Failed to save recommendations: {error}", exc_info=True)
                 raise
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("Recommendations")
 
     def start_reading(self, book_id: int) -> None:
         """Atomic operation: remove from reading list and add 'In Progress' record.
@@ -854,30 +1180,132 @@ class GoogleSheetsStorage:
         self.remove_from_reading_list(book_id)
 
         # 2. Add 'In Progress' record
-        from datetime import date
-
         today = date.today().isoformat()
         self.add_reading_record(book_id=book_id, status="In Progress", start_date=today)
         logger.info(f"START_READING completed for book_id={book_id}")
 
+    def _cache_books(self, books: List[Dict[str, Any]]) -> None:
+        """Keep parsed books with id and ISBN lookups until the data changes."""
+        self._books_by_id = {}
+        self._books_by_isbn = {}
+        for book in books:
+            self._books_by_id.setdefault(book["id"], book)
+            self._books_by_isbn.setdefault(normalize_isbn(book["isbn13"]), book)
+        self._books_cache = books
+
+    def _books_tab_cached(self) -> bool:
+        """Check whether Books values are available without a full fetch."""
+        if "Books" in self._cache:
+            return True
+        if not self.spreadsheet_id:
+            return False
+        cached = self._load_cached_tabs(self.spreadsheet_id)
+        if cached and "Books" in cached:
+            self._store_values(cached)
+            return True
+        return False
+
+    def _fetch_book_row(
+        self, column: str, matches: Callable[[Any], bool]
+    ) -> Optional[Dict[str, Any]]:
+        """Find a book by reading one column and then only its row.
+
+        Avoids downloading every column of every book for a single lookup.
+        Returns None if no row matches.
+        """
+        sid = self._ensure_spreadsheet_id()
+        assert self.service is not None
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .get(
+                    spreadsheetId=sid,
+                    range=f"Books!{column}:{column}",
+                    fields="values",
+                )
+                .execute()
+            )
+        except HttpError as error:
+            if error.resp.status == 400:
+                self.initialize_sheets()
+                return None
+            raise Exception(f"Failed to fetch books: {error}") from error
+
+        cells = result.get("values", [])
+        row_number = next(
+            (
+                number
+                for number, cell in enumerate(cells[1:], start=2)
+                if cell and matches(cell[0])
+            ),
+            None,
+        )
+        if row_number is None:
+            return None
+
+        # Header, the matching row and the small author tabs in one request
+        ranges = [
+            "Books!A1:P1",
+            f"Books!A{row_number}:P{row_number}",
+            "Authors!A:B",
+            "BookAuthors!A:B",
+        ]
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .batchGet(
+                    spreadsheetId=sid, ranges=ranges, fields="valueRanges(values)"
+                )
+                .execute()
+            )
+        except HttpError as error:
+            raise Exception(f"Failed to fetch book: {error}") from error
+        header, row, authors, links = (
+            vr.get("values", []) for vr in result.get("valueRanges", [])
+        )
+        self._store_values({"Authors": authors, "BookAuthors": links})
+
+        # Rows may have moved between the two reads; only trust the row if
+        # it still holds the matched value
+        cells = row[0] if row else []
+        index = ord(column) - ord("A")
+        still_matches = len(cells) > index and matches(cells[index])
+        book = (
+            self._parse_book_row(cells, len(header[0]))
+            if header and still_matches
+            else None
+        )
+        if book is None:
+            # Malformed, moved or headerless; let the full scan decide
+            self.get_all_books()
+            return None
+        self._attach_authors([book])
+        return book
+
     def get_book_by_id(self, book_id: int) -> Optional[Dict[str, Any]]:
         """Get a single book by ID."""
-        books = self.get_all_books()
-        for book in books:
-            if book["id"] == book_id:
+        if self._books_cache is None and not self._books_tab_cached():
+            book = self._fetch_book_row("A", lambda cell: _parse_id(cell) == book_id)
+            if book is not None or self._books_cache is None:
                 return book
-        return None
+        self.get_all_books()
+        book = self._books_by_id.get(book_id)
+        return dict(book) if book is not None else None
 
     def get_book_by_isbn(self, isbn13: str) -> Optional[Dict[str, Any]]:
         """Get a single book by ISBN-13."""
-        from book_lamp.utils.books import normalize_isbn
-
         target_isbn = normalize_isbn(isbn13)
-        books = self.get_all_books()
-        for book in books:
-            if normalize_isbn(book["isbn13"]) == target_isbn:
+        if self._books_cache is None and not self._books_tab_cached():
+            book = self._fetch_book_row(
+                "B", lambda cell: normalize_isbn(cell) == target_isbn
+            )
+            if book is not None or self._books_cache is None:
                 return book
-        return None
+        self.get_all_books()
+        book = self._books_by_isbn.get(target_isbn)
+        return dict(book) if book is not None else None
 
     def add_book(
         self,
@@ -897,13 +1325,17 @@ class GoogleSheetsStorage:
         physical_format: Optional[str] = None,
         edition: Optional[str] = None,
         cover_url: Optional[str] = None,
+        book_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Add a new book to the Books tab."""
-        from book_lamp.utils.books import normalize_isbn
+        """Add a new book to the Books tab.
 
+        Pass ``book_id`` when the ID is already allocated (e.g. by the local
+        store) to skip reading the ID column before the append.
+        """
         sid = self._ensure_spreadsheet_id()
         assert self.service is not None
-        book_id = self._get_next_id("Books")
+        if book_id is None:
+            book_id = self._get_next_id("Books")
         created_at = datetime.now(timezone.utc).isoformat()
         clean_isbn_val = normalize_isbn(isbn13)
 
@@ -912,20 +1344,20 @@ class GoogleSheetsStorage:
             clean_isbn_val,
             title,
             author,
-            publication_year if publication_year else "",
-            thumbnail_url if thumbnail_url else "",
+            publication_year or "",
+            thumbnail_url or "",
             created_at,
-            publisher if publisher else "",
-            description if description else "",
-            series if series else "",
-            bisac_category if bisac_category else "",
-            bisac_main_category if bisac_main_category else "",
-            bisac_sub_category if bisac_sub_category else "",
-            language if language else "",
-            page_count if page_count else "",
-            physical_format if physical_format else "",
-            edition if edition else "",
-            cover_url if cover_url else "",
+            publisher or "",
+            description or "",
+            series or "",
+            bisac_category or "",
+            bisac_main_category or "",
+            bisac_sub_category or "",
+            language or "",
+            page_count or "",
+            physical_format or "",
+            edition or "",
+            cover_url or "",
         ]
         try:
             self.service.spreadsheets().values().append(
@@ -937,8 +1369,6 @@ class GoogleSheetsStorage:
 
             # Sync authors
             self._sync_book_authors(sid, book_id, author)
-            from book_lamp.utils.authors import split_authors
-
             return {
                 "id": book_id,
                 "isbn13": isbn13,
@@ -973,8 +1403,6 @@ class GoogleSheetsStorage:
                     ).execute()
                     # Sync authors
                     self._sync_book_authors(sid, book_id, author)
-                    from book_lamp.utils.authors import split_authors
-
                     return {
                         "id": book_id,
                         "isbn13": isbn13,
@@ -1003,7 +1431,64 @@ class GoogleSheetsStorage:
             logger.error(f"Failed to add book: {error}")
             raise Exception(f"Failed to add book: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("Books", "Authors", "BookAuthors")
+
+    def _read_book_rows(self, sid: str) -> Optional[List[List[Any]]]:
+        """Read every Books row fresh, for writes that need row positions.
+
+        Returns None if the tab is missing, after creating it.
+        """
+        assert self.service is not None
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .get(spreadsheetId=sid, range="Books!A:R", fields="values")
+                .execute()
+            )
+        except HttpError as error:
+            if error.resp.status == 400:
+                self.initialize_sheets()
+                return None
+            raise
+        values = result.get("values", [])
+        self._remember_book_rows(values)
+        return values
+
+    def _remember_book_rows(self, values: List[List[Any]]) -> None:
+        """Note which sheet row holds each book, from a read of the Books tab."""
+        self._book_rows = {
+            book_id: number
+            for number, row in enumerate(values[1:], start=2)
+            if row and (book_id := _parse_id(row[0])) is not None
+        }
+
+    def _read_known_book_row(
+        self, sid: str, book_id: int
+    ) -> Optional[Tuple[int, List[Any]]]:
+        """Read only the book's row if its position is known and still right."""
+        number = self._book_rows.get(book_id)
+        if number is None:
+            return None
+        assert self.service is not None
+        try:
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .get(
+                    spreadsheetId=sid,
+                    range=f"Books!A{number}:R{number}",
+                    fields="values",
+                )
+                .execute()
+            )
+        except HttpError:
+            return None
+        row = next(iter(result.get("values", [])), [])
+        # Another client may have deleted rows since; fall back to a full read
+        if not row or _parse_id(row[0]) != book_id:
+            return None
+        return number, row
 
     def update_book(
         self,
@@ -1024,28 +1509,28 @@ class GoogleSheetsStorage:
         physical_format: Optional[str] = None,
         edition: Optional[str] = None,
         cover_url: Optional[str] = None,
+        existing_row: Optional[Tuple[int, List[Any]]] = None,
     ) -> Dict[str, Any]:
-        """Update an existing book in the Books tab."""
-        from book_lamp.utils.books import normalize_isbn
+        """Update an existing book in the Books tab.
 
+        Pass ``existing_row`` as the book's (row number, cells) when they were
+        just read, e.g. by upsert_book, to skip reading the tab again. Failing
+        that, a row position remembered from an earlier read means only that
+        row is fetched.
+        """
         sid = self._ensure_spreadsheet_id()
         assert self.service is not None
         clean_isbn_val = normalize_isbn(isbn13)
 
-        # Get all data to find the row index
-        try:
-            result = (
-                self.service.spreadsheets()
-                .values()
-                .get(spreadsheetId=sid, range="Books!A:R")
-                .execute()
-            )
-        except HttpError as error:
-            if error.resp.status == 400:
-                self.initialize_sheets()
-                raise Exception(f"Book with ID {book_id} not found")
-            raise
-        values = result.get("values", [])
+        if existing_row is None:
+            existing_row = self._read_known_book_row(sid, book_id)
+        if existing_row is not None:
+            values = [[], existing_row[1]]
+            first_row = existing_row[0]
+        else:
+            # Get all data to find the row index
+            values = self._read_book_rows(sid) or []
+            first_row = 2
         if len(values) <= 1:
             raise Exception(f"Book with ID {book_id} not found")
 
@@ -1065,7 +1550,7 @@ class GoogleSheetsStorage:
         existing_physical_format = None
         existing_edition = None
 
-        for idx, row in enumerate(values[1:], start=2):
+        for idx, row in enumerate(values[1:], start=first_row):
             if row and row[0] and int(float(row[0])) == book_id:
                 row_index = idx
                 existing_thumbnail = row[5] if len(row) > 5 else None
@@ -1121,20 +1606,20 @@ class GoogleSheetsStorage:
             clean_isbn_val,
             title,
             author,
-            publication_year if publication_year else "",
-            thumbnail_url if thumbnail_url else "",
+            publication_year or "",
+            thumbnail_url or "",
             created_at,
-            publisher if publisher else "",
-            description if description else "",
-            series if series else "",
-            bisac_category if bisac_category else "",
-            bisac_main_category if bisac_main_category else "",
-            bisac_sub_category if bisac_sub_category else "",
-            language if language else "",
-            page_count if page_count else "",
-            physical_format if physical_format else "",
-            edition if edition else "",
-            cover_url if cover_url else "",
+            publisher or "",
+            description or "",
+            series or "",
+            bisac_category or "",
+            bisac_main_category or "",
+            bisac_sub_category or "",
+            language or "",
+            page_count or "",
+            physical_format or "",
+            edition or "",
+            cover_url or "",
         ]
 
         try:
@@ -1147,8 +1632,6 @@ class GoogleSheetsStorage:
 
             # Sync authors
             self._sync_book_authors(sid, book_id, author)
-            from book_lamp.utils.authors import split_authors
-
             return {
                 "id": book_id,
                 "isbn13": isbn13,
@@ -1177,7 +1660,7 @@ class GoogleSheetsStorage:
             logger.error(f"Failed to update book: {error}")
             raise Exception(f"Failed to update book: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("Books", "Authors", "BookAuthors")
 
     def upsert_book(
         self,
@@ -1198,11 +1681,28 @@ class GoogleSheetsStorage:
         edition: Optional[str] = None,
         cover_url: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Add a new book or update an existing one if ISBN matches."""
-        existing = self.get_book_by_isbn(isbn13)
-        if existing:
+        """Add a new book or update an existing one if ISBN matches.
+
+        One fresh read of the tab serves the match, the row to update and the
+        next ID, so neither branch reads it again.
+        """
+        sid = self._ensure_spreadsheet_id()
+        values = self._read_book_rows(sid) or []
+        width = len(values[0]) if values else 0
+        target_isbn = normalize_isbn(isbn13)
+        match = None
+        # Every ID in column A counts, including rows too incomplete to parse
+        max_id = _highest_id(row[0] for row in values[1:] if row)
+        for number, row in enumerate(values[1:], start=2):
+            book = self._parse_book_row(row, width)
+            if book is None:
+                continue
+            if match is None and normalize_isbn(book["isbn13"]) == target_isbn:
+                match = (book["id"], (number, row))
+
+        if match:
             return self.update_book(
-                book_id=existing["id"],
+                book_id=match[0],
                 isbn13=isbn13,
                 title=title,
                 author=author,
@@ -1219,8 +1719,11 @@ class GoogleSheetsStorage:
                 physical_format=physical_format,
                 edition=edition,
                 cover_url=cover_url,
+                existing_row=match[1],
             )
         else:
+            # The fresh read is authoritative, so move the counter past it too
+            self._next_ids[(sid, "Books")] = max_id + 2
             return self.add_book(
                 isbn13=isbn13,
                 title=title,
@@ -1238,6 +1741,7 @@ class GoogleSheetsStorage:
                 physical_format=physical_format,
                 edition=edition,
                 cover_url=cover_url,
+                book_id=max_id + 1,
             )
 
     def bulk_import(self, items: List[Dict[str, Any]]) -> int:
@@ -1247,43 +1751,24 @@ class GoogleSheetsStorage:
 
         try:
             # 1. Fetch all existing data once
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.info(f"Starting bulk import of {len(items)} items")
-            try:
-                books_result = (
-                    self.service.spreadsheets()
-                    .values()
-                    .get(spreadsheetId=sid, range="Books!A:R")
-                    .execute()
-                )
-            except HttpError as e:
-                if e.resp.status == 400:
-                    self.initialize_sheets()
-                    books_result = {"values": []}
-                else:
-                    raise
-
-            try:
-                records_result = (
-                    self.service.spreadsheets()
-                    .values()
-                    .get(spreadsheetId=sid, range="ReadingRecords!A:G")
-                    .execute()
-                )
-            except HttpError as e:
-                if e.resp.status == 400:
-                    self.initialize_sheets()
-                    records_result = {"values": []}
-                else:
-                    raise
+            tabs = self._fetch_tabs(
+                sid,
+                {
+                    "Books": "Books!A:R",
+                    "ReadingRecords": "ReadingRecords!A:G",
+                    "Authors": "Authors!A:B",
+                    "BookAuthors": "BookAuthors!A:B",
+                },
+            )
+            # get_authors / get_book_authors below read these from memory
+            self._store_values(
+                {"Authors": tabs["Authors"], "BookAuthors": tabs["BookAuthors"]}
+            )
 
-            book_values = books_result.get("values", [])
+            book_values = tabs["Books"]
             existing_books = {}  # normalized_isbn -> (row_data, row_index)
             next_book_id = 1
-            from book_lamp.utils.books import normalize_isbn
-
             for idx, row in enumerate(book_values[1:], start=2):
                 if row and len(row) > 1:
                     # Normalize ISBN for lookup
@@ -1296,7 +1781,7 @@ class GoogleSheetsStorage:
                     except (ValueError, TypeError):
                         pass
 
-            record_values = records_result.get("values", [])
+            record_values = tabs["ReadingRecords"]
             existing_records_by_book = {}
             next_record_id = 1
             for idx, row in enumerate(record_values[1:], start=2):
@@ -1306,9 +1791,9 @@ class GoogleSheetsStorage:
                             next_record_id = max(next_record_id, int(float(row[0])) + 1)
                         if row[1]:
                             bid = int(float(row[1]))
-                            if bid not in existing_records_by_book:
-                                existing_records_by_book[bid] = []
-                            existing_records_by_book[bid].append((idx, row))
+                            existing_records_by_book.setdefault(bid, []).append(
+                                (idx, row)
+                            )
                     except (ValueError, IndexError, TypeError):
                         pass
 
@@ -1317,18 +1802,13 @@ class GoogleSheetsStorage:
             name_to_id = {a["name"]: a["id"] for a in all_authors}
             next_author_id = max([a["id"] for a in all_authors] + [0]) + 1
 
-            all_links = self.get_book_authors()
-            # book_id -> set of author_ids
-            existing_links = {}
-            for link in all_links:
-                bid = link["book_id"]
-                aid = link["author_id"]
-                if bid not in existing_links:
-                    existing_links[bid] = set()
-                existing_links[bid].add(aid)
+            # (book_id, author_id) pairs already linked
+            existing_links = {
+                (link["book_id"], link["author_id"]) for link in self.get_book_authors()
+            }
 
             # 2. Process items
-            books_to_update = []  # list of {"range": ..., "values": [[...]]}
+            books_to_update = []  # list of (row_number, row)
             books_to_append = []
             records_to_append = []
             records_to_update = []
@@ -1336,8 +1816,6 @@ class GoogleSheetsStorage:
             links_to_append = []
             import_count = 0
 
-            from book_lamp.utils.authors import split_authors
-
             for item in items:
                 b = item["book"]
                 r = item["record"]
@@ -1415,11 +1893,7 @@ class GoogleSheetsStorage:
                         isbn,
                         _sanitize_for_sheets(b["title"]),
                         _sanitize_for_sheets(b["author"]),
-                        (
-                            _sanitize_for_sheets(b["publication_year"])
-                            if b.get("publication_year")
-                            else ""
-                        ),
+                        _sanitize_for_sheets(b.get("publication_year") or ""),
                         thumb,
                         cat,
                         pub,
@@ -1434,9 +1908,7 @@ class GoogleSheetsStorage:
                         ed,
                         cu,
                     ]
-                    books_to_update.append(
-                        {"range": f"Books!A{row_idx}:R{row_idx}", "values": [new_row]}
-                    )
+                    books_to_update.append((row_idx, new_row))
                 else:
                     # Append new
                     book_id = next_book_id
@@ -1446,11 +1918,7 @@ class GoogleSheetsStorage:
                         isbn,
                         _sanitize_for_sheets(b["title"]),
                         _sanitize_for_sheets(b["author"]),
-                        (
-                            _sanitize_for_sheets(b.get("publication_year"))
-                            if b.get("publication_year")
-                            else ""
-                        ),
+                        _sanitize_for_sheets(b.get("publication_year") or ""),
                         _sanitize_for_sheets(b.get("thumbnail_url")) or "",
                         created_at,
                         _sanitize_for_sheets(b.get("publisher")) or "",
@@ -1469,7 +1937,6 @@ class GoogleSheetsStorage:
 
                 # Process authors for this book
                 names = split_authors(b["author"])
-                current_book_aids = existing_links.get(book_id, set())
 
                 for name in names:
                     if name not in name_to_id:
@@ -1479,13 +1946,10 @@ class GoogleSheetsStorage:
                         authors_to_append.append([aid, name])
 
                     aid = name_to_id[name]
-                    if aid not in current_book_aids:
+                    if (book_id, aid) not in existing_links:
                         links_to_append.append([book_id, aid])
                         # Add to existing to prevent internal duplicates
-                        current_book_aids.add(aid)
-                        if book_id not in existing_links:
-                            existing_links[book_id] = set()
-                        existing_links[book_id].add(aid)
+                        existing_links.add((book_id, aid))
 
                 if r:
                     is_duplicate = False
@@ -1494,9 +1958,9 @@ class GoogleSheetsStorage:
                     r_start = r["start_date"]
                     r_end = r.get("end_date") or ""
 
-                    existing_recs = existing_records_by_book.get(book_id, [])
+                    existing_recs = existing_records_by_book.setdefault(book_id, [])
 
-                    for idx, ek_row in existing_recs:
+                    for pos, (idx, ek_row) in enumerate(existing_recs):
                         ek_status = ek_row[2] if len(ek_row) > 2 else ""
                         ek_start = ek_row[3] if len(ek_row) > 3 else ""
                         ek_end = ek_row[4] if len(ek_row) > 4 else ""
@@ -1524,13 +1988,13 @@ class GoogleSheetsStorage:
                             ):
                                 is_duplicate = True
                             else:
-                                matched_row_to_update = (idx, ek_row)
+                                matched_row_to_update = (pos, idx, ek_row)
                             break
 
                     if is_duplicate:
                         pass
                     elif matched_row_to_update:
-                        idx, ek_row = matched_row_to_update
+                        pos, idx, ek_row = matched_row_to_update
                         if idx is not None:
                             record_id = int(ek_row[0])
                             rec_created_at = (
@@ -1546,19 +2010,13 @@ class GoogleSheetsStorage:
                                 or (ek_row[5] if len(ek_row) > 5 else 0),
                                 rec_created_at,
                             ]
-                            records_to_update.append(
-                                {
-                                    "range": f"ReadingRecords!A{idx}:G{idx}",
-                                    "values": [updated_row],
-                                }
-                            )
+                            records_to_update.append((idx, updated_row))
                             logger.info(
                                 f"READING_RECORD_UPDATED (Sheets bulk): id={record_id}, "
                                 f"status_change='{ek_row[2] if len(ek_row) > 2 else ''}'->'{r_status}'"
                             )
 
-                            matched_idx = existing_recs.index(matched_row_to_update)
-                            existing_recs[matched_idx] = (idx, updated_row)
+                            existing_recs[pos] = (idx, updated_row)
                     else:
                         new_rec_row = [
                             next_record_id,
@@ -1571,102 +2029,30 @@ class GoogleSheetsStorage:
                         ]
                         records_to_append.append(new_rec_row)
                         existing_recs.append((None, new_rec_row))
-                        existing_records_by_book[book_id] = existing_recs
                         next_record_id += 1
 
                 import_count += 1
 
-            # 3. Execute batch operations
-            if books_to_update or records_to_update:
-                data = books_to_update + records_to_update
-                self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=sid,
-                    body={"valueInputOption": "RAW", "data": data},
-                ).execute()
-
-            if books_to_append:
-                # Batch append new books
-                try:
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="Books",
-                        valueInputOption="RAW",
-                        body={"values": books_to_append},
-                    ).execute()
-                except HttpError as error:
-                    if error.resp.status == 400:
-                        self.initialize_sheets()
-                        self.service.spreadsheets().values().append(
-                            spreadsheetId=sid,
-                            range="Books",
-                            valueInputOption="RAW",
-                            body={"values": books_to_append},
-                        ).execute()
-                    else:
-                        raise
-
-            if records_to_append:
-                # Batch append new records
-                try:
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="ReadingRecords",
-                        valueInputOption="RAW",
-                        body={"values": records_to_append},
-                    ).execute()
-                except HttpError as error:
-                    if error.resp.status == 400:
-                        self.initialize_sheets()
-                        self.service.spreadsheets().values().append(
-                            spreadsheetId=sid,
-                            range="ReadingRecords",
-                            valueInputOption="RAW",
-                            body={"values": records_to_append},
-                        ).execute()
-                    else:
-                        raise
-
-            if authors_to_append:
-                # Batch append new authors
-                try:
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="Authors",
-                        valueInputOption="RAW",
-                        body={"values": authors_to_append},
-                    ).execute()
-                except HttpError as error:
-                    if error.resp.status == 400:
-                        self.initialize_sheets()
-                        self.service.spreadsheets().values().append(
-                            spreadsheetId=sid,
-                            range="Authors",
-                            valueInputOption="RAW",
-                            body={"values": authors_to_append},
-                        ).execute()
-                    else:
-                        raise
-
-            if links_to_append:
-                # Batch append new links
-                try:
-                    self.service.spreadsheets().values().append(
-                        spreadsheetId=sid,
-                        range="BookAuthors",
-                        valueInputOption="RAW",
-                        body={"values": links_to_append},
-                    ).execute()
-                except HttpError as error:
-                    if error.resp.status == 400:
-                        self.initialize_sheets()
-                        self.service.spreadsheets().values().append(
-                            spreadsheetId=sid,
-                            range="BookAuthors",
-                            valueInputOption="RAW",
-                            body={"values": links_to_append},
-                        ).execute()
-                    else:
-                        raise
+            # 3. Send every row update and append in one batchUpdate
+            def build_requests() -> List[Dict[str, Any]]:
+                requests = [
+                    *self._update_rows_requests("Books", books_to_update),
+                    *self._update_rows_requests("ReadingRecords", records_to_update),
+                ]
+                for tab, rows in (
+                    ("Books", books_to_append),
+                    ("ReadingRecords", records_to_append),
+                    ("Authors", authors_to_append),
+                    ("BookAuthors", links_to_append),
+                ):
+                    if rows:
+                        requests.append(self._append_rows_request(tab, rows))
+                return requests
+
+            self._send_row_requests(sid, build_requests)
+            # Later adds on this instance carry on from the import's IDs
+            self._next_ids[(sid, "Books")] = next_book_id
+            self._next_ids[(sid, "ReadingRecords")] = next_record_id
 
             logger.info(
                 f"Executed batch operations: {len(books_to_update)} updates, {len(books_to_append)} appends, {len(records_to_append)} records"
@@ -1675,6 +2061,68 @@ class GoogleSheetsStorage:
             self._clear_persistent_cache()
         return import_count
 
+    def _update_rows_requests(
+        self, tab_name: str, updates: List[Tuple[int, List[Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Build batchUpdate requests overwriting (1-based) rows of a tab.
+
+        Consecutive rows are written by one request.
+        """
+        if not updates:
+            return []
+        sheet_id = self._get_sheet_id(tab_name)
+        return [
+            {
+                "updateCells": {
+                    "start": {
+                        "sheetId": sheet_id,
+                        "rowIndex": first - 1,
+                        "columnIndex": 0,
+                    },
+                    "rows": _row_data(rows),
+                    "fields": "userEnteredValue",
+                }
+            }
+            for first, rows in _coalesce_rows(updates)
+        ]
+
+    def _append_rows_request(
+        self, tab_name: str, rows: List[List[Any]]
+    ) -> Dict[str, Any]:
+        """Build a batchUpdate request appending rows after a tab's data."""
+        return {
+            "appendCells": {
+                "sheetId": self._get_sheet_id(tab_name),
+                "rows": _row_data(rows),
+                "fields": "userEnteredValue",
+            }
+        }
+
+    def _send_row_requests(
+        self, sid: str, build_requests: Callable[[], List[Dict[str, Any]]]
+    ) -> None:
+        """Send row writes in one batchUpdate.
+
+        The requests address tabs by sheet ID; if the batch is rejected the
+        cached IDs may be stale, so they are looked up again and the batch
+        is rebuilt and retried once.
+        """
+        assert self.service is not None
+        requests = build_requests()
+        if not requests:
+            return
+        try:
+            self.service.spreadsheets().batchUpdate(
+                spreadsheetId=sid, body={"requests": requests}
+            ).execute()
+        except HttpError as error:
+            if error.resp.status != 400:
+                raise
+            self._forget_sheet_ids(sid)
+            self.service.spreadsheets().batchUpdate(
+                spreadsheetId=sid, body={"requests": build_requests()}
+            ).execute()
+
     def add_reading_record(
         self,
         book_id: int,
@@ -1694,7 +2142,7 @@ class GoogleSheetsStorage:
             book_id,
             status,
             start_date,
-            end_date if end_date else "",
+            end_date or "",
             rating,
             created_at,
         ]
@@ -1749,7 +2197,7 @@ class GoogleSheetsStorage:
             logger.error(f"Failed to add reading record: {error}")
             raise Exception(f"Failed to add reading record: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingRecords")
 
     def update_reading_record(
         self,
@@ -1768,7 +2216,7 @@ class GoogleSheetsStorage:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range="ReadingRecords!A:G")
+                .get(spreadsheetId=sid, range="ReadingRecords!A:G", fields="values")
                 .execute()
             )
         except HttpError as error:
@@ -1805,7 +2253,7 @@ class GoogleSheetsStorage:
             book_id,
             status,
             start_date,
-            end_date if end_date else "",
+            end_date or "",
             rating,
             created_at,
         ]
@@ -1842,38 +2290,50 @@ class GoogleSheetsStorage:
                 f"status_change='{old_status}'->'{status}'"
             )
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingRecords")
 
-    def delete_reading_record(self, record_id: int) -> bool:
-        """Delete a reading record by ID."""
-        sid = self._ensure_spreadsheet_id()
-        assert self.service is not None
+    def _find_row_index(self, sid: str, tab_name: str, row_id: int) -> Optional[int]:
+        """Find the 0-based row holding an ID, reading only the ID column.
 
-        # Get all data to find the row index
+        The column is always read fresh: a stale row index would delete the
+        wrong row.
+        """
+        assert self.service is not None
         try:
             result = (
                 self.service.spreadsheets()
                 .values()
-                .get(spreadsheetId=sid, range="ReadingRecords!A:A")
+                .get(
+                    spreadsheetId=sid,
+                    range=f"{tab_name}!A:A",
+                    majorDimension="COLUMNS",
+                    fields="values",
+                )
                 .execute()
             )
         except HttpError as error:
             if error.resp.status == 400:
                 self.initialize_sheets()
-                return False
+                return None
             raise
 
-        values = result.get("values", [])
-        if len(values) <= 1:
-            return False
+        column = next(iter(result.get("values", [])), [])
+        # Row 0 is the header
+        return next(
+            (
+                idx
+                for idx, cell in enumerate(column[1:], start=1)
+                if _parse_id(cell) == row_id
+            ),
+            None,
+        )
 
-        # Find the row index
-        row_index = None
-        for idx, row in enumerate(values[1:], start=2):
-            if row and row[0] and int(row[0]) == record_id:
-                row_index = idx
-                break
+    def delete_reading_record(self, record_id: int) -> bool:
+        """Delete a reading record by ID."""
+        sid = self._ensure_spreadsheet_id()
+        assert self.service is not None
 
+        row_index = self._find_row_index(sid, "ReadingRecords", record_id)
         if row_index is None:
             return False
 
@@ -1885,8 +2345,8 @@ class GoogleSheetsStorage:
                         "range": {
                             "sheetId": sheet_id,
                             "dimension": "ROWS",
-                            "startIndex": row_index - 1,
-                            "endIndex": row_index,
+                            "startIndex": row_index,
+                            "endIndex": row_index + 1,
                         }
                     }
                 }
@@ -1898,41 +2358,18 @@ class GoogleSheetsStorage:
             ).execute()
             return True
         except HttpError as error:
+            self._forget_sheet_ids(sid)
             logger.error(f"Failed to delete reading record: {error}")
             raise Exception(f"Failed to delete reading record: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("ReadingRecords")
 
     def delete_book(self, book_id: int) -> bool:
         """Delete a book by ID."""
         sid = self._ensure_spreadsheet_id()
         assert self.service is not None
         try:
-            # Get all data
-            try:
-                result = (
-                    self.service.spreadsheets()
-                    .values()
-                    .get(spreadsheetId=sid, range="Books!A:P")
-                    .execute()
-                )
-            except HttpError as error:
-                if error.resp.status == 400:
-                    self.initialize_sheets()
-                    return False
-                raise
-
-            values = result.get("values", [])
-            if len(values) <= 1:
-                return False
-
-            # Find the row index (add 1 for header, add 1 for 1-based indexing)
-            row_index = None
-            for idx, row in enumerate(values[1:], start=2):
-                if row and row[0] and int(row[0]) == book_id:
-                    row_index = idx
-                    break
-
+            row_index = self._find_row_index(sid, "Books", book_id)
             if row_index is None:
                 return False
 
@@ -1942,81 +2379,139 @@ class GoogleSheetsStorage:
                     "range": {
                         "sheetId": self._get_sheet_id("Books"),
                         "dimension": "ROWS",
-                        "startIndex": row_index - 1,
-                        "endIndex": row_index,
+                        "startIndex": row_index,
+                        "endIndex": row_index + 1,
                     }
                 }
             }
 
+            self._book_rows = {}
             self.service.spreadsheets().batchUpdate(
                 spreadsheetId=sid, body={"requests": [request]}
             ).execute()
 
             return True
         except HttpError as error:
+            self._forget_sheet_ids(sid)
             raise Exception(f"Failed to delete book: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("Books")
+
+    def _remember_sheet_ids(self, sid: str, sheets: List[Dict[str, Any]]) -> None:
+        """Record tab sheet IDs from spreadsheet metadata, in memory and on disk."""
+        ids = {
+            sheet["properties"]["title"]: int(sheet["properties"]["sheetId"])
+            for sheet in sheets
+        }
+        for title, sheet_id in ids.items():
+            self._sheet_ids[(sid, title)] = sheet_id
+        get_cache().set(f"sheet_ids:{sid}", ids)
+
+    def _forget_sheet_ids(self, sid: str) -> None:
+        """Drop cached sheet IDs, e.g. after a request using one failed."""
+        for key in [k for k in self._sheet_ids if k[0] == sid]:
+            del self._sheet_ids[key]
+        get_cache().delete(f"sheet_ids:{sid}")
 
     def _get_sheet_id(self, tab_name: str) -> int:
         """Get the sheet ID for a given tab name."""
         sid = self._ensure_spreadsheet_id()
+        if (sid, tab_name) in self._sheet_ids:
+            return self._sheet_ids[(sid, tab_name)]
+
+        # Sheet IDs are stable, so reuse those seen by earlier processes
+        cached = get_cache().get(f"sheet_ids:{sid}")
+        if isinstance(cached, dict) and tab_name in cached:
+            for title, sheet_id in cached.items():
+                self._sheet_ids[(sid, title)] = int(sheet_id)
+            return self._sheet_ids[(sid, tab_name)]
         assert self.service is not None
-        try:
+
+        def lookup() -> Optional[int]:
+            assert self.service is not None
             sheet_metadata = (
-                self.service.spreadsheets().get(spreadsheetId=sid).execute()
+                self.service.spreadsheets()
+                .get(spreadsheetId=sid, fields="sheets(properties(title,sheetId))")
+                .execute()
             )
-            for sheet in sheet_metadata.get("sheets", []):
-                if sheet["properties"]["title"] == tab_name:
-                    return int(sheet["properties"]["sheetId"])
+            self._remember_sheet_ids(sid, sheet_metadata.get("sheets", []))
+            return self._sheet_ids.get((sid, tab_name))
+
+        try:
+            sheet_id = lookup()
+            if sheet_id is not None:
+                return sheet_id
 
             # Not found, try initializing
             self.initialize_sheets()
-            sheet_metadata = (
-                self.service.spreadsheets().get(spreadsheetId=sid).execute()
-            )
-            for sheet in sheet_metadata.get("sheets", []):
-                if sheet["properties"]["title"] == tab_name:
-                    return int(sheet["properties"]["sheetId"])
+            sheet_id = self._sheet_ids.get((sid, tab_name))
+            if sheet_id is not None:
+                return sheet_id
 
             raise Exception(f"Tab '{tab_name}' not found after initialization")
         except HttpError as error:
             raise Exception(f"Failed to get sheet ID: {error}") from error
 
+    def _get_sheet_metadata_with_headers(
+        self, sid: str, tabs: List[str]
+    ) -> Dict[str, Any]:
+        """Fetch tab properties together with the header row of each tab.
+
+        Ranges naming a missing tab make the whole request fail, so on a 400
+        list the tabs first and then read headers for those that exist; a
+        tab that has to be created has no header yet.
+        """
+        assert self.service is not None
+        fields = (
+            "sheets(properties(title,sheetId)," "data(rowData(values(formattedValue))))"
+        )
+
+        def fetch(names: List[str]) -> Dict[str, Any]:
+            assert self.service is not None
+            return (
+                self.service.spreadsheets()
+                .get(
+                    spreadsheetId=sid,
+                    ranges=[f"{tab}!A1:Z1" for tab in names],
+                    fields=fields,
+                )
+                .execute()
+            )
+
+        try:
+            return fetch(tabs)
+        except HttpError as e:
+            if e.resp.status != 400:
+                raise
+        properties = (
+            self.service.spreadsheets()
+            .get(spreadsheetId=sid, fields="sheets(properties(title,sheetId))")
+            .execute()
+        )
+        present = {sheet["properties"]["title"] for sheet in properties["sheets"]}
+        existing = [tab for tab in tabs if tab in present]
+        if not existing:
+            return properties
+        # Tabs outside the list come back without data and are left alone
+        return fetch(existing)
+
+    @staticmethod
+    def _header_row(sheet: Dict[str, Any]) -> List[str]:
+        """Return the non-empty header cells from a grid-data sheet entry."""
+        for grid in sheet.get("data", []):
+            for row in grid.get("rowData", []):
+                return [
+                    cell["formattedValue"]
+                    for cell in row.get("values", [])
+                    if cell.get("formattedValue")
+                ]
+        return []
+
     def initialize_sheets(self) -> None:
         """Initialise the spreadsheet with required tabs and headers."""
         sid = self._ensure_spreadsheet_id()
         assert self.service is not None
         try:
-            # Refresh sheet metadata to get current state
-            sheet_metadata = (
-                self.service.spreadsheets().get(spreadsheetId=sid).execute()
-            )
-            sheets_in_doc = [
-                s["properties"]["title"] for s in sheet_metadata.get("sheets", [])
-            ]
-
-            # 1. Create missing tabs in one batch
-            required_tabs = [
-                "Books",
-                "ReadingRecords",
-                "Authors",
-                "BookAuthors",
-                "ReadingList",
-                "Recommendations",
-                "Settings",
-            ]
-            add_requests = []
-            for tab in required_tabs:
-                if tab not in sheets_in_doc:
-                    add_requests.append({"addSheet": {"properties": {"title": tab}}})
-
-            if add_requests:
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=sid, body={"requests": add_requests}
-                ).execute()
-
-            # 2. Setup headers for each tab
             tab_headers = {
                 "Books": [
                     "id",
@@ -2061,86 +2556,98 @@ class GoogleSheetsStorage:
                 "Settings": ["key", "value"],
             }
 
-            for tab, headers in tab_headers.items():
-                try:
-                    # Check if headers exist
-                    result = (
-                        self.service.spreadsheets()
-                        .values()
-                        .get(spreadsheetId=sid, range=f"{tab}!A1:Z1")
-                        .execute()
-                    )
-                    values = result.get("values", [])
-                    if not values or not values[0]:
-                        # Write headers
-                        self.service.spreadsheets().values().update(
-                            spreadsheetId=sid,
-                            range=f"{tab}!A1",
-                            valueInputOption="RAW",
-                            body={"values": [headers]},
-                        ).execute()
-                except HttpError as e:
-                    if e.resp.status == 400:
-                        # This should usually not happen if tab was created above,
-                        # but if it does, it confirms the tab is missing or range is invalid.
-                        continue
-                    raise
-
-            # Add headers for Authors if not present
-            result = (
-                self.service.spreadsheets()
-                .values()
-                .get(spreadsheetId=sid, range="Authors!A1:B1")
-                .execute()
+            # Tab list, sheet IDs and existing header rows in one call
+            sheet_metadata = self._get_sheet_metadata_with_headers(
+                sid, list(tab_headers)
             )
-            values = result.get("values", [])
-
-            if not values:
-                headers = [["id", "name"]]
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=sid,
-                    range="Authors!A1:B1",
-                    valueInputOption="RAW",
-                    body={"values": headers},
-                ).execute()
+            sheets = sheet_metadata.get("sheets", [])
+            self._remember_sheet_ids(sid, sheets)
+            existing_headers = {
+                sheet["properties"]["title"]: self._header_row(sheet)
+                for sheet in sheets
+            }
 
-            # Add headers for BookAuthors if not present
-            result = (
-                self.service.spreadsheets()
-                .values()
-                .get(spreadsheetId=sid, range="BookAuthors!A1:B1")
-                .execute()
-            )
-            values = result.get("values", [])
+            # Create missing tabs and write missing headers in one batch.
+            # New tabs get IDs chosen here so their header writes can
+            # target them within the same request.
+            sheet_ids = {
+                sheet["properties"]["title"]: int(sheet["properties"]["sheetId"])
+                for sheet in sheets
+            }
+            next_sheet_id = max(sheet_ids.values(), default=0) + 1
+            requests: List[Dict[str, Any]] = []
+            for tab, headers in tab_headers.items():
+                if tab not in sheet_ids:
+                    sheet_ids[tab] = next_sheet_id
+                    next_sheet_id += 1
+                    requests.append(
+                        {
+                            "addSheet": {
+                                "properties": {"title": tab, "sheetId": sheet_ids[tab]}
+                            }
+                        }
+                    )
+                if not existing_headers.get(tab):
+                    requests.append(
+                        {
+                            "updateCells": {
+                                "start": {
+                                    "sheetId": sheet_ids[tab],
+                                    "rowIndex": 0,
+                                    "columnIndex": 0,
+                                },
+                                "rows": [
+                                    {
+                                        "values": [
+                                            {"userEnteredValue": {"stringValue": h}}
+                                            for h in headers
+                                        ]
+                                    }
+                                ],
+                                "fields": "userEnteredValue",
+                            }
+                        }
+                    )
 
-            if not values:
-                headers = [["book_id", "author_id"]]
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=sid,
-                    range="BookAuthors!A1:B1",
-                    valueInputOption="RAW",
-                    body={"values": headers},
+            if requests:
+                self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=sid, body={"requests": requests}
                 ).execute()
+                self._remember_sheet_ids(
+                    sid,
+                    [
+                        {"properties": {"title": title, "sheetId": sheet_id}}
+                        for title, sheet_id in sheet_ids.items()
+                    ],
+                )
 
         except HttpError as error:
             raise Exception(f"Failed to initialize sheets: {error}") from error
         finally:
             self._clear_persistent_cache()
 
-    def search(self, query: str) -> List[Dict[str, Any]]:
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search across all book data fields.
 
         Args:
             query: Search query (free text).
+            limit: Return only this many of the most relevant books.
 
         Returns:
             List of matching books with reading_records attached, sorted by relevance.
         """
-        from book_lamp.services.search import search_books
-
+        # Books, their authors and the records in one round trip when cold
+        self._load_tabs(
+            {
+                "Books": "Books!A:P",
+                "Authors": "Authors!A:B",
+                "BookAuthors": "BookAuthors!A:B",
+                "ReadingRecords": "ReadingRecords!A:G",
+            }
+        )
         all_books = self.get_all_books()
         all_records = self.get_reading_records()
-        return search_books(all_books, all_records, query)
+        return search_books(all_books, all_records, query, limit=limit)
 
     def get_reading_history(self) -> List[Dict[str, Any]]:
         """Retrieve all reading records joined with book metadata."""
@@ -2226,4 +2733,4 @@ class GoogleSheetsStorage:
                 return
             raise Exception(f"Failed to update setting: {error}") from error
         finally:
-            self._clear_persistent_cache()
+            self._clear_persistent_cache("Settings")
@@ -30,7 +30,9 @@ class SQLiteStateStore:
         return json.loads(row[0])
 
     def set(self, key: str, value: Any) -> None:
-        payload = json.dumps(value)
+        # Whole collections are rewritten on every local change, so keep the
+        # encoding pass cheap: no padding and no escaping of non-ASCII text
+        payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
         with self._lock:
             with self._conn:
                 self._conn.execute(
@@ -48,3 +48,70 @@ def test_async_sqlite_storage_records_failed_sync():
     diag = storage.get_sync_diagnostics()
     assert diag["outbox"]["failed"] >= 1
     assert diag["metrics"]["failed"] >= 1
+
+
+def test_async_sqlite_storage_maps_local_book_ids_to_sheet_ids():
+    synced = []
+
+    class RecordingRemote:
+        def add_book(self, **kwargs):  # noqa: ANN003
+            synced.append(("add_book", kwargs))
+            return {"id": 40}
+
+        def add_to_reading_list(self, book_id):  # noqa: ANN001
+            synced.append(("add_to_reading_list", book_id))
+
+    storage = AsyncSQLiteStorage(sheet_name="TestSheet")
+    storage._new_remote = lambda: RecordingRemote()  # type: ignore[method-assign]
+    storage.configure_remote(credentials_dict={"token": "dummy"})
+
+    book = storage.add_book(
+        isbn13="9780000000003",
+        title="Sheet Picks The ID",
+        author="Test Author",
+    )
+    storage.add_to_reading_list(book["id"])
+    storage.wait_for_idle(timeout_seconds=1.0)
+
+    assert "book_id" not in synced[0][1]
+    assert synced[1] == ("add_to_reading_list", 40)
+
+
+def test_async_sqlite_storage_bootstrap_drops_stale_id_mappings():
+    synced = []
+
+    class BootstrapRemote:
+        spreadsheet_id = "sid"
+
+        def prefetch(self, force=False):  # noqa: ANN001
+            pass
+
+        def get_all_books(self):
+            return [{"id": 5, "isbn13": "9780000000005", "title": "Five"}]
+
+        def get_reading_records(self):
+            return []
+
+        def get_reading_list(self):
+            return []
+
+        def get_recommendations(self):
+            return []
+
+        def get_settings(self):
+            return {}
+
+        def add_to_reading_list(self, book_id):  # noqa: ANN001
+            synced.append(book_id)
+
+    storage = AsyncSQLiteStorage(sheet_name="TestSheet")
+    storage._new_remote = lambda: BootstrapRemote()  # type: ignore[method-assign]
+    storage.configure_remote(credentials_dict={"token": "dummy"})
+    storage._remote_book_ids = {5: 40}
+
+    storage._bootstrap_lock.acquire()  # held by whoever starts the bootstrap
+    storage._bootstrap_from_remote()
+    storage.add_to_reading_list(5)
+    storage.wait_for_idle(timeout_seconds=1.0)
+
+    assert synced == [5]
@@ -0,0 +1,47 @@
+"""Tests for the persistent SQLite cache."""
+
+import sqlite3
+
+from book_lamp.services.cache import SQLiteCache
+
+
+def test_cache_roundtrip_preserves_unicode(tmp_path):
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+    value = {"title": "Les Misérables", "authors": ["Victor Hugo"], "pages": 1462}
+
+    cache.set("isbn:1", value)
+
+    assert cache.get("isbn:1") == value
+
+
+def test_cache_expired_entry_is_not_returned(tmp_path):
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+
+    cache.set("isbn:1", {"title": "Old"}, ttl=-1)
+
+    assert cache.get("isbn:1") is None
+
+
+def test_cleanup_removes_expired_entries_and_compact_keeps_live_ones(tmp_path):
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("expired", "old", ttl=-1)
+    cache.set("live", "new")
+
+    assert cache.cleanup() == 1
+    cache.compact()
+
+    assert cache.get("live") == "new"
+
+
+def test_cache_compresses_large_values(tmp_path):
+    db_path = tmp_path / "cache.db"
+    cache = SQLiteCache(db_path=str(db_path))
+    value = {"description": "A long and winding description. " * 100}
+
+    cache.set("isbn:1", value)
+
+    with sqlite3.connect(db_path) as conn:
+        (stored,) = conn.execute("SELECT value FROM cache").fetchone()
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(value["description"])
+    assert cache.get("isbn:1") == value
@@ -0,0 +1,71 @@
+"""Tests for the background job queue."""
+
+import threading
+
+from book_lamp.services.job_queue import JobQueue, JobStatus
+
+
+def test_update_progress_clamps_and_ignores_unknown_jobs():
+    queue = JobQueue()
+    job_id = queue.create_job("task")
+
+    assert queue.update_progress(job_id, 150) is True
+    assert queue.jobs[job_id].progress == 100
+    assert queue.update_progress(job_id, -5) is True
+    assert queue.jobs[job_id].progress == 0
+    assert queue.update_progress("missing", 50) is False
+
+
+def test_submit_job_runs_task_on_worker_pool():
+    queue = JobQueue(max_workers=1)
+    job_id = queue.submit_job("task", lambda job_id, value: f"done {value}", 42)
+
+    job = queue.get_job(job_id)
+    assert job.wait_for_completion(timeout=5)
+    assert job.result == "done 42"
+    queue.shutdown()
+
+
+def test_wait_for_completion_wakes_on_failure_and_times_out_otherwise():
+    queue = JobQueue(max_workers=1)
+    job_id = queue.create_job("task")
+    job = queue.get_job(job_id)
+
+    assert job.wait_for_completion(timeout=0.01) is False
+
+    queue.fail_job(job_id, "boom")
+    assert job.wait_for_completion(timeout=0.01) is True
+    assert "_done" not in job.to_dict()
+
+
+def test_workers_do_not_block_interpreter_exit():
+    queue = JobQueue(max_workers=2)
+    job_id = queue.submit_job("task", lambda job_id: "ok")
+
+    assert queue.get_job(job_id).wait_for_completion(timeout=5)
+    assert queue._workers and all(worker.daemon for worker in queue._workers)
+    queue.shutdown()
+
+
+def test_bad_worker_count_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("JOB_QUEUE_WORKERS", "eight")
+    assert JobQueue()._max_workers == 8
+
+    monkeypatch.setenv("JOB_QUEUE_WORKERS", "0")
+    assert JobQueue()._max_workers == 1
+
+
+def test_shutdown_cancels_jobs_that_never_started():
+    queue = JobQueue(max_workers=1)
+    release = threading.Event()
+    running = queue.submit_job("task", lambda job_id: release.wait(5))
+    waiting = queue.submit_job("task", lambda job_id: "ok")
+
+    queue.shutdown()
+    release.set()
+
+    job = queue.get_job(waiting)
+    assert job.wait_for_completion(timeout=0.01)
+    assert job.status is JobStatus.FAILED
+    assert job.error == "cancelled"
+    assert queue.get_job(running).wait_for_completion(timeout=5)
@@ -0,0 +1,172 @@
+"""Tests for the in-memory MockStorage indexes."""
+
+from book_lamp.services.mock_storage import MockStorage
+
+
+def test_lookups_follow_isbn_change_and_delete():
+    storage = MockStorage()
+    book = storage.add_book(isbn13="978-0-00-000000-1", title="T", author="A")
+
+    assert storage.get_book_by_isbn("9780000000001") is book
+    assert storage.get_book_by_id(book["id"]) is book
+
+    storage.update_book(book["id"], isbn13="9780000000002", title="T", author="A")
+    assert storage.get_book_by_isbn("9780000000001") is None
+    assert storage.get_book_by_isbn("9780000000002") is book
+
+    assert storage.delete_book(book["id"]) is True
+    assert storage.get_book_by_id(book["id"]) is None
+    assert storage.get_book_by_isbn("9780000000002") is None
+    assert storage.books == []
+
+
+def test_assigning_collections_rebuilds_indexes():
+    storage = MockStorage()
+    storage.books = [{"id": 7, "isbn13": "9780000000007", "title": "T"}]
+    storage.reading_records = [
+        {"id": 1, "book_id": 7, "status": "Completed", "start_date": "2024-01-01"}
+    ]
+
+    assert storage.get_book_by_id(7)["title"] == "T"
+    assert storage.get_book_by_isbn("9780000000007")["id"] == 7
+    assert [r["id"] for r in storage.get_reading_records(book_id=7)] == [1]
+
+
+def test_reading_records_by_book_track_add_and_delete():
+    storage = MockStorage()
+    first = storage.add_reading_record(1, "Completed", "2024-01-01")
+    storage.add_reading_record(2, "In Progress", "2024-02-01")
+
+    assert [r["id"] for r in storage.get_reading_records(book_id=1)] == [first["id"]]
+
+    storage.delete_reading_record(first["id"])
+    assert storage.get_reading_records(book_id=1) == []
+
+
+def test_bulk_import_skips_exact_duplicates_and_updates_same_attempt():
+    storage = MockStorage()
+    book = {
+        "isbn13": "9780000000001",
+        "title": "T",
+        "author": "A",
+        "publication_year": None,
+    }
+    started = {"status": "In Progress", "start_date": "2024-01-01", "end_date": None}
+    finished = {
+        "status": "Completed",
+        "start_date": "2024-01-01",
+        "end_date": "2024-02-01",
+    }
+
+    storage.bulk_import([{"book": book, "record": started}])
+    storage.bulk_import([{"book": book, "record": started}])
+    assert len(storage.reading_records) == 1
+
+    storage.bulk_import([{"book": book, "record": finished}])
+    records = storage.get_reading_records()
+    assert len(records) == 1
+    assert records[0]["status"] == "Completed"
+
+
+def test_search_sees_updates_after_earlier_query():
+    storage = MockStorage()
+    book = storage.add_book(
+        isbn13="9780000000001", title="Dune", author="Frank Herbert"
+    )
+    assert [b["id"] for b in storage.search("dune")] == [book["id"]]
+
+    storage.update_book(
+        book["id"], isbn13="9780000000001", title="Arrakis", author="Frank Herbert"
+    )
+    record = storage.add_reading_record(book["id"], "Abandoned", "2024-02-01")
+
+    assert storage.search("dune") == []
+    assert [b["id"] for b in storage.search("abandon")] == [book["id"]]
+
+    storage.delete_reading_record(record["id"])
+    assert storage.search("abandon") == []
+
+
+def test_search_builds_each_book_text_once(monkeypatch):
+    from book_lamp.services import mock_storage, search
+
+    built = []
+    build = search.searchable_text
+
+    def counting(book, records):
+        built.append(book["id"])
+        return build(book, records)
+
+    monkeypatch.setattr(mock_storage, "searchable_text", counting)
+    monkeypatch.setattr(search, "searchable_text", counting)
+    storage = MockStorage()
+    storage.add_book(isbn13="9780000000001", title="Dune", author="Frank Herbert")
+    storage.add_book(isbn13="9780000000002", title="Emma", author="Jane Austen")
+
+    assert len(storage.search("dune")) == 1
+    assert len(storage.search("frank")) == 1
+    assert sorted(built) == [1, 2]
+
+
+def test_search_matches_partial_words_case_insensitively():
+    storage = MockStorage()
+    storage.add_book(
+        isbn13="9780000000001", title="The Hobbit", author="J.R.R. Tolkien"
+    )
+
+    results = storage.search("TOLK")
+
+    assert len(results) == 1
+    assert results[0]["_relevance_score"] > 0
+
+
+def test_search_matches_non_ascii_case_insensitively():
+    storage = MockStorage()
+    storage.add_book(isbn13="9780000000001", title="ÉMILE", author="Rousseau")
+
+    assert len(storage.search("émile")) == 1
+
+
+def test_update_book_resplits_authors_only_when_author_changes():
+    storage = MockStorage()
+    book = storage.add_book(isbn13="9780000000001", title="T", author="A")
+
+    storage.update_book(book["id"], isbn13="9780000000001", title="T2", author="A")
+    assert book["authors"] == ["A"]
+
+    storage.update_book(
+        book["id"], isbn13="9780000000001", title="T2", author="Jane Doe; John Roe"
+    )
+    assert book["authors"] == ["Jane Doe", "John Roe"]
+
+
+def test_reading_records_are_found_by_id_after_reassignment():
+    storage = MockStorage()
+    storage.reading_records = [
+        {"id": 5, "book_id": 1, "status": "Completed", "start_date": "2024-01-01"},
+        {"id": 6, "book_id": 1, "status": "In Progress", "start_date": "2024-02-01"},
+    ]
+
+    storage.update_reading_record(6, "Abandoned", "2024-02-01")
+    assert storage.delete_reading_record(5) is True
+    assert storage.delete_reading_record(5) is False
+
+    assert [(r["id"], r["status"]) for r in storage.get_reading_records(1)] == [
+        (6, "Abandoned")
+    ]
+
+
+def test_authors_follow_author_edited_in_place():
+    storage = MockStorage()
+    storage.add_book(isbn13="9780000000001", title="T", author="Old Author")
+    storage.add_book(isbn13="9780000000002", title="U", author="Old Author")
+    first, second = storage.get_all_books()
+
+    # As enhance_books_batch does before the books are saved back
+    first["author"] = "New One & Other Person"
+    storage.update_book(first["id"], first["isbn13"], first["title"], first["author"])
+    second["author"] = "Someone Else"
+    storage.bulk_import([{"book": second, "record": None}])
+
+    assert first["authors"] == ["New One", "Other Person"]
+    assert second["authors"] == ["Someone Else"]
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from book_lamp.services.sheets_storage import SCOPES, GoogleSheetsStorage
 
 
@@ -25,44 +27,50 @@ def test_bulk_import_batch_efficiency():
     mock_spreadsheets = mock_service.spreadsheets.return_value
     mock_values = mock_spreadsheets.values.return_value
 
-    # Mock sequence for get() calls: Books, ReadingRecords
+    # One batchGet for Books, ReadingRecords, Authors and BookAuthors
     # (Discovery/Setup calls like _ensure_spreadsheet_id are mocked separately)
-    mock_values.get.return_value.execute.side_effect = [
-        {
-            "values": [
-                [
-                    "id",
-                    "isbn13",
-                    "title",
-                    "author",
-                    "publication_year",
-                    "thumbnail_url",
-                    "created_at",
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {
+                "values": [
+                    [
+                        "id",
+                        "isbn13",
+                        "title",
+                        "author",
+                        "publication_year",
+                        "thumbnail_url",
+                        "created_at",
+                    ]
                 ]
-            ]
-        },  # Books
-        {
-            "values": [
-                [
-                    "id",
-                    "book_id",
-                    "status",
-                    "start_date",
-                    "end_date",
-                    "rating",
-                    "created_at",
+            },  # Books
+            {
+                "values": [
+                    [
+                        "id",
+                        "book_id",
+                        "status",
+                        "start_date",
+                        "end_date",
+                        "rating",
+                        "created_at",
+                    ]
                 ]
-            ]
-        },  # ReadingRecords
-    ]
+            },  # ReadingRecords
+            {"values": [["id", "name"]]},  # Authors
+            {"values": [["book_id", "author_id"]]},  # BookAuthors
+        ]
+    }
 
     storage = GoogleSheetsStorage("TestSheet")
     storage.service = mock_service
 
     # Isolated dependencies to avoid triggering extra API calls during test setup
     storage._ensure_spreadsheet_id = MagicMock(return_value="dummy_id")
-    storage.get_authors = MagicMock(return_value=[])
-    storage.get_book_authors = MagicMock(return_value=[])
+    for sheet_id, tab in enumerate(
+        ["Books", "ReadingRecords", "Authors", "BookAuthors"], start=1
+    ):
+        storage._sheet_ids[("dummy_id", tab)] = sheet_id
 
     # 10 items to import
     items = []
@@ -87,21 +95,21 @@ def test_bulk_import_batch_efficiency():
     storage.bulk_import(items)
 
     # Assertions:
-    # 1. Should fetch Books metadata ONCE
-    # 2. Should fetch ReadingRecords ONCE
-    # (These are the side_effects we set up)
+    # 1. Should fetch all four tabs in ONE batchGet
+    assert mock_values.batchGet.call_count == 1
+    mock_values.get.assert_not_called()
 
-    # 3. Should perform BATCH append for books (1 call for 10 books)
-    # 4. Should perform BATCH append for records (1 call for 10 records)
+    # 2. Should write every new row in ONE batchUpdate: an appendCells per tab
+    # for all 10 books, records, authors and links, rather than N+1 requests
+    mock_values.append.assert_not_called()
+    assert mock_spreadsheets.batchUpdate.call_count == 1
+    requests = mock_spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+    assert [r["appendCells"]["sheetId"] for r in requests] == [1, 2, 3, 4]
+    assert len(requests[0]["appendCells"]["rows"]) == 10
 
-    # We check the 'execute' calls on the append return value
-    append_execute_count = mock_values.append.return_value.execute.call_count
-
-    # We expect 4 append calls: Books, ReadingRecords, Authors, BookAuthors
-    # But crucially, NOT 10 or 20.
-    assert (
-        append_execute_count <= 4
-    ), f"Expected batch append (<=4 calls), but got {append_execute_count} calls. N+1 pattern detected!"
+    # 3. IDs handed out afterwards continue from the import without a read
+    assert storage._get_next_id("ReadingRecords") == 11
+    mock_values.get.assert_not_called()
 
 
 def test_get_all_books_efficiency():
@@ -110,56 +118,731 @@ def test_get_all_books_efficiency():
     mock_values = mock_service.spreadsheets.return_value.values.return_value
 
     # Mock data with enough columns to satisfy the indexing in get_all_books
-    mock_values.get.return_value.execute.side_effect = [
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {
+                "values": [
+                    [
+                        "id",
+                        "isbn13",
+                        "title",
+                        "author",
+                        "publication_year",
+                        "thumbnail_url",
+                        "created_at",
+                        "publisher",
+                        "description",
+                        "series",
+                        "bisac_category",
+                        "language",
+                        "page_count",
+                        "physical_format",
+                        "edition",
+                        "cover_url",
+                    ],
+                    [
+                        "1",
+                        "123",
+                        "T",
+                        "A",
+                        "2020",
+                        "http://t.jpg",
+                        "today",
+                        "pub",
+                        "desc",
+                        "ser",
+                        "800",
+                        "en",
+                        "100",
+                        "Hardcover",
+                        "1st",
+                        "http://c.jpg",
+                    ],
+                ]
+            },  # Books
+            {"values": [["id", "name"], ["1", "A"]]},  # Authors
+            {"values": [["book_id", "author_id"], ["1", "1"]]},  # BookAuthors
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    storage.get_all_books()
+
+    # Books, Authors and BookAuthors should come back in one batchGet
+    assert mock_values.batchGet.call_count == 1
+    mock_values.get.assert_not_called()
+
+
+def test_book_lookups_and_sheet_ids_reuse_cached_data():
+    """Lookups by ID/ISBN and sheet IDs should not repeat API calls."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {
+                "values": [
+                    ["id", "isbn13", "title", "author", "year", "thumb", "created"],
+                    ["1", "123", "T", "A"],
+                ]
+            },
+            {"values": [["id", "name"]]},  # Authors
+            {"values": [["book_id", "author_id"]]},  # BookAuthors
+        ]
+    }
+    mock_service.spreadsheets.return_value.get.return_value.execute.return_value = {
+        "sheets": [
+            {"properties": {"title": "Books", "sheetId": 11}},
+            {"properties": {"title": "ReadingRecords", "sheetId": 22}},
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    storage.get_all_books()
+    assert storage.get_book_by_id(1)["title"] == "T"
+    assert storage.get_book_by_isbn("123")["id"] == 1
+    assert storage.get_book_by_id(2) is None
+    assert mock_values.batchGet.call_count == 1
+    mock_values.get.assert_not_called()
+
+    assert storage._get_sheet_id("Books") == 11
+    assert storage._get_sheet_id("ReadingRecords") == 22
+    assert mock_service.spreadsheets.return_value.get.call_count == 1
+
+
+def test_next_id_reads_column_once_per_instance():
+    """Consecutive ID allocations should not re-read the ID column."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.get.return_value.execute.return_value = {
+        "values": [["1", "7.0", "", "x"]]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    assert storage._get_next_id("Books") == 8
+    assert storage._get_next_id("Books") == 9
+    assert mock_values.get.call_count == 1
+    assert mock_values.get.call_args.kwargs["majorDimension"] == "COLUMNS"
+
+
+def test_next_id_is_seeded_from_loaded_rows():
+    """Tabs already in memory should seed the counter without a read."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+    storage._cache["ReadingRecords"] = [["ID", "Book ID"], ["3", "1"], [], ["12", "2"]]
+
+    assert storage._get_next_id("ReadingRecords") == 13
+    assert storage._get_next_id("ReadingRecords") == 14
+    mock_values.get.assert_not_called()
+
+
+def test_sheet_ids_are_reused_across_instances(tmp_path, monkeypatch):
+    """A new storage instance should read sheet IDs from the persistent cache."""
+    from book_lamp.services import sheets_storage
+    from book_lamp.services.cache import SQLiteCache
+
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+    monkeypatch.setattr(sheets_storage, "get_cache", lambda: cache)
+
+    def make_storage():
+        mock_service = MagicMock()
+        spreadsheets = mock_service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            "sheets": [{"properties": {"title": "Books", "sheetId": 11}}]
+        }
+        storage = GoogleSheetsStorage("TestSheet")
+        storage.service = mock_service
+        storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+        return storage, spreadsheets
+
+    first, first_api = make_storage()
+    assert first._get_sheet_id("Books") == 11
+    assert first_api.get.call_count == 1
+
+    second, second_api = make_storage()
+    assert second._get_sheet_id("Books") == 11
+    assert second_api.get.call_count == 0
+
+
+def test_folder_path_is_resolved_with_one_drive_query():
+    """Existing folder hierarchies should be found with a single list call."""
+    mock_drive = MagicMock()
+    files = mock_drive.files.return_value
+    files.list.return_value.execute.return_value = {
+        "files": [
+            {"id": "book-lamp", "name": "BookLamp", "parents": ["app-data"]},
+            {"id": "app-data", "name": "AppData", "parents": ["root-id"]},
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.drive_service = mock_drive
+
+    assert storage._get_or_create_folder_path("AppData/BookLamp") == "book-lamp"
+    assert files.list.call_count == 1
+    files.create.assert_not_called()
+
+
+def test_folder_path_creates_missing_components():
+    """Missing folders are created beneath the deepest existing one."""
+    mock_drive = MagicMock()
+    files = mock_drive.files.return_value
+    files.list.return_value.execute.return_value = {
+        "files": [{"id": "app-data", "name": "AppData", "parents": ["root-id"]}]
+    }
+    files.create.return_value.execute.return_value = {"id": "new-folder"}
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.drive_service = mock_drive
+
+    assert storage._get_or_create_folder_path("AppData/BookLamp") == "new-folder"
+    body = files.create.call_args.kwargs["body"]
+    assert body["name"] == "BookLamp"
+    assert body["parents"] == ["app-data"]
+
+
+def test_cold_book_lookup_fetches_only_the_matching_row():
+    """Without cached data a lookup should not download the whole Books tab."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.get.return_value.execute.return_value = {
+        "values": [["isbn13"], ["111"], ["978-0-00-000000-2"]]
+    }
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {"values": [["id", "isbn13", "title", "author", "y", "t", "c"]]},
+            {"values": [["2", "9780000000002", "Found", "Jane Doe"]]},
+            {"values": [["id", "name"], ["1", "Jane Doe"]]},
+            {"values": [["book_id", "author_id"], ["2", "1"]]},
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    book = storage.get_book_by_isbn("9780000000002")
+
+    assert book["title"] == "Found"
+    assert book["authors"] == ["Jane Doe"]
+    assert mock_values.get.call_args.kwargs["range"] == "Books!B:B"
+    assert mock_values.get.call_args.kwargs["fields"] == "values"
+    ranges = mock_values.batchGet.call_args.kwargs["ranges"]
+    assert "Books!A3:P3" in ranges
+
+
+def test_cold_book_lookup_rechecks_a_row_that_moved():
+    """If the matched row changed before it was read, fall back to a full scan."""
+    header = ["id", "isbn13", "title", "author", "y", "t", "c"]
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.get.return_value.execute.return_value = {
+        "values": [["id"], ["1"], ["2"]]
+    }
+    mock_values.batchGet.return_value.execute.side_effect = [
+        # Book 1 was deleted meanwhile, so row 3 now holds another book
+        {
+            "valueRanges": [
+                {"values": [header]},
+                {"values": [["3", "9780000000003", "Wrong", "X"]]},
+                {"values": [["id", "name"]]},
+                {"values": [["book_id", "author_id"]]},
+            ]
+        },
         {
-            "values": [
-                [
-                    "id",
-                    "isbn13",
-                    "title",
-                    "author",
-                    "publication_year",
-                    "thumbnail_url",
-                    "created_at",
-                    "publisher",
-                    "description",
-                    "series",
-                    "bisac_category",
-                    "language",
-                    "page_count",
-                    "physical_format",
-                    "edition",
-                    "cover_url",
-                ],
-                [
-                    "1",
-                    "123",
-                    "T",
-                    "A",
-                    "2020",
-                    "http://t.jpg",
-                    "today",
-                    "pub",
-                    "desc",
-                    "ser",
-                    "800",
-                    "en",
-                    "100",
-                    "Hardcover",
-                    "1st",
-                    "http://c.jpg",
-                ],
+            "valueRanges": [
+                {
+                    "values": [
+                        header,
+                        ["2", "9780000000002", "Right", "Y"],
+                        ["3", "9780000000003", "Wrong", "X"],
+                    ]
+                },
+                {"values": [["id", "name"]]},
+                {"values": [["book_id", "author_id"]]},
             ]
-        },  # Books
-        {"values": [["id", "name"], ["1", "A"]]},  # Authors
-        {"values": [["book_id", "author_id"], ["1", "1"]]},  # BookAuthors
+        },
+    ]
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    assert storage.get_book_by_id(2)["title"] == "Right"
+
+
+def test_initialize_sheets_reads_and_writes_in_one_call_each():
+    """Tabs and headers are read with one get and fixed with one batchUpdate."""
+    tabs = [
+        "Books",
+        "ReadingRecords",
+        "Authors",
+        "BookAuthors",
+        "ReadingList",
+        "Recommendations",
+    ]
+    sheets = [
+        {
+            "properties": {"title": tab, "sheetId": i},
+            "data": [{"rowData": [{"values": [{"formattedValue": "id"}]}]}],
+        }
+        for i, tab in enumerate(tabs)
+    ]
+    sheets[4]["data"] = [{}]  # ReadingList has no header yet; Settings is missing
+
+    mock_service = MagicMock()
+    spreadsheets = mock_service.spreadsheets.return_value
+    spreadsheets.get.return_value.execute.return_value = {"sheets": sheets}
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    storage.initialize_sheets()
+
+    assert spreadsheets.get.call_count == 1
+    assert "Books!A1:Z1" in spreadsheets.get.call_args.kwargs["ranges"]
+    spreadsheets.values.return_value.get.assert_not_called()
+    spreadsheets.values.return_value.batchUpdate.assert_not_called()
+    assert spreadsheets.batchUpdate.call_count == 1
+    requests = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+    assert requests[0]["updateCells"]["start"]["sheetId"] == 4
+    assert requests[1]["addSheet"]["properties"] == {"title": "Settings", "sheetId": 6}
+    assert requests[2]["updateCells"]["start"]["sheetId"] == 6
+    assert len(requests) == 3
+    assert storage._get_sheet_id("Settings") == 6
+
+
+def test_initialize_sheets_keeps_headers_when_a_tab_is_missing():
+    """A missing tab must not cause existing header rows to be rewritten."""
+    from googleapiclient.errors import HttpError  # type: ignore
+
+    tabs = [
+        "Books",
+        "ReadingRecords",
+        "Authors",
+        "BookAuthors",
+        "ReadingList",
+        "Recommendations",
+    ]
+    properties = [
+        {"properties": {"title": t, "sheetId": i}} for i, t in enumerate(tabs)
+    ]
+    with_headers = [
+        {**sheet, "data": [{"rowData": [{"values": [{"formattedValue": "id"}]}]}]}
+        for sheet in properties
+    ]
+
+    mock_service = MagicMock()
+    spreadsheets = mock_service.spreadsheets.return_value
+    spreadsheets.get.return_value.execute.side_effect = [
+        HttpError(MagicMock(status=400), b"Unable to parse range: Settings!A1:Z1"),
+        {"sheets": properties},
+        {"sheets": with_headers},
     ]
 
     storage = GoogleSheetsStorage("TestSheet")
     storage.service = mock_service
     storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
 
+    storage.initialize_sheets()
+
+    assert spreadsheets.get.call_args.kwargs["ranges"] == [
+        f"{tab}!A1:Z1" for tab in tabs
+    ]
+    requests = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+    assert requests[0]["addSheet"]["properties"] == {"title": "Settings", "sheetId": 6}
+    assert [r["updateCells"]["start"]["sheetId"] for r in requests[1:]] == [6]
+
+
+def test_add_book_with_known_id_skips_id_read():
+    """An already-allocated ID should make add_book a plain append."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+    storage._sync_book_authors = MagicMock()
+
+    book = storage.add_book("9780000000004", "Title", "Author", book_id=42)
+
+    assert book["id"] == 42
+    mock_values.get.assert_not_called()
+    row = mock_values.append.call_args.kwargs["body"]["values"][0]
+    assert row[0] == 42
+
+
+def test_upsert_book_reads_the_books_tab_once():
+    """Matching, updating and allocating an ID should share one read."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.get.return_value.execute.return_value = {
+        "values": [
+            ["ID", "ISBN13", "Title", "Author"],
+            ["1", "9780000000001", "One", "A"],
+            ["7", "9780000000002", "Two", "B"],
+            ["9", "9780000000003", "", ""],
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+    storage._sync_book_authors = MagicMock()
+
+    updated = storage.upsert_book("978-0000000002", "Two again", "B")
+    assert updated["id"] == 7
+    assert mock_values.get.call_count == 1
+    assert mock_values.update.call_args.kwargs["range"] == "Books!A3:R3"
+
+    mock_values.get.reset_mock()
+    added = storage.upsert_book("9780000000009", "Nine", "C")
+    # The unparseable row's ID 9 is still taken
+    assert added["id"] == 10
+    assert mock_values.get.call_count == 1
+    assert mock_values.append.call_args.kwargs["body"]["values"][0][0] == 10
+
+
+def test_update_book_reads_only_a_known_row():
+    """After a full read, updating a book should fetch just its row."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    full = {
+        "values": [
+            ["ID", "ISBN13", "Title", "Author"],
+            ["1", "9780000000001", "One", "A"],
+            ["7", "9780000000002", "Two", "B"],
+        ]
+    }
+    mock_values.get.return_value.execute.return_value = full
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+    storage._sync_book_authors = MagicMock()
+
+    storage.update_book(7, "9780000000002", "Two", "B")
+    mock_values.get.reset_mock()
+    mock_values.get.return_value.execute.return_value = {"values": [full["values"][2]]}
+
+    storage.update_book(7, "9780000000002", "Two again", "B")
+
+    assert mock_values.get.call_count == 1
+    assert mock_values.get.call_args.kwargs["range"] == "Books!A3:R3"
+    assert mock_values.update.call_args.kwargs["range"] == "Books!A3:R3"
+
+
+def test_spreadsheet_discovery_uses_one_drive_query():
+    """Folders and the spreadsheet should be found with a single list call."""
+    folder_mime = "application/vnd.google-apps.folder"
+    sheet_mime = "application/vnd.google-apps.spreadsheet"
+    mock_drive = MagicMock()
+    files = mock_drive.files.return_value
+    files.list.return_value.execute.return_value = {
+        "files": [
+            {"id": "app-data", "name": "AppData", "mimeType": folder_mime},
+            {
+                "id": "book-lamp",
+                "name": "BookLamp",
+                "mimeType": folder_mime,
+                "parents": ["app-data"],
+            },
+            {
+                "id": "elsewhere",
+                "name": "TestSheet",
+                "mimeType": sheet_mime,
+                "parents": ["other"],
+            },
+            {
+                "id": "sheet-id",
+                "name": "TestSheet",
+                "mimeType": sheet_mime,
+                "parents": ["book-lamp"],
+            },
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = MagicMock()
+    storage.drive_service = mock_drive
+
+    assert storage._ensure_spreadsheet_id() == "sheet-id"
+    assert files.list.call_count == 1
+    files.create.assert_not_called()
+
+
+def test_delete_book_reads_only_the_id_column():
+    """Deleting a book should locate its row from column A alone."""
+    mock_service = MagicMock()
+    spreadsheets = mock_service.spreadsheets.return_value
+    mock_values = spreadsheets.values.return_value
+    mock_values.get.return_value.execute.return_value = {
+        "values": [["id", "1", "", "3.0"]]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+    storage._sheet_ids[("sid", "Books")] = 11
+
+    assert storage.delete_book(3) is True
+
+    assert mock_values.get.call_args.kwargs["range"] == "Books!A:A"
+    request = spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"][0]
+    assert request["deleteDimension"]["range"] == {
+        "sheetId": 11,
+        "dimension": "ROWS",
+        "startIndex": 3,
+        "endIndex": 4,
+    }
+
+
+def test_cached_tabs_are_reused_until_the_spreadsheet_changes(tmp_path, monkeypatch):
+    """Persistently cached data is served only while modifiedTime matches."""
+    from book_lamp.services import sheets_storage
+    from book_lamp.services.cache import SQLiteCache
+
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+    monkeypatch.setattr(sheets_storage, "get_cache", lambda: cache)
+    monkeypatch.setattr(sheets_storage, "MODIFIED_CHECK_WINDOW", 0)
+    monkeypatch.setattr(sheets_storage, "_recent_modified", {})
+
+    def prefetch_with(modified_time):
+        mock_service = MagicMock()
+        mock_values = mock_service.spreadsheets.return_value.values.return_value
+        mock_values.batchGet.return_value.execute.return_value = {
+            "valueRanges": [{"values": [["id"], ["1"]]}]
+        }
+        mock_drive = MagicMock()
+        mock_drive.files.return_value.get.return_value.execute.return_value = {
+            "modifiedTime": modified_time
+        }
+        storage = GoogleSheetsStorage("TestSheet", spreadsheet_id="sid")
+        storage.service = mock_service
+        storage.drive_service = mock_drive
+        storage.prefetch()
+        return mock_values.batchGet.call_count
+
+    assert prefetch_with("2024-01-01T00:00:00Z") == 1
+    assert prefetch_with("2024-01-01T00:00:00Z") == 0
+    assert prefetch_with("2024-01-02T00:00:00Z") == 1
+
+
+def test_recent_modified_time_check_is_shared_between_instances(tmp_path, monkeypatch):
+    """Instances created moments apart should not each ask Drive again."""
+    from book_lamp.services import sheets_storage
+    from book_lamp.services.cache import SQLiteCache
+
+    cache = SQLiteCache(db_path=str(tmp_path / "cache.db"))
+    monkeypatch.setattr(sheets_storage, "get_cache", lambda: cache)
+    monkeypatch.setattr(sheets_storage, "_recent_modified", {})
+    mock_drive = MagicMock()
+    mock_drive.files.return_value.get.return_value.execute.return_value = {
+        "modifiedTime": "2024-01-01T00:00:00Z"
+    }
+
+    def prefetch():
+        mock_service = MagicMock()
+        mock_values = mock_service.spreadsheets.return_value.values.return_value
+        mock_values.batchGet.return_value.execute.return_value = {
+            "valueRanges": [{"values": [["id"], ["1"]]}]
+        }
+        storage = GoogleSheetsStorage("TestSheet", spreadsheet_id="sid")
+        storage.service = mock_service
+        storage.drive_service = mock_drive
+        storage.prefetch()
+        return storage
+
+    prefetch()
+    for _ in range(3):
+        prefetch()
+    assert mock_drive.files.return_value.get.call_count == 1
+
+    prefetch()._clear_persistent_cache("Books")
+    prefetch()
+    assert mock_drive.files.return_value.get.call_count == 2
+
+
+def test_services_share_one_http_client_per_thread(monkeypatch):
+    """Storage instances on one thread should reuse the same HTTP connections."""
+    from book_lamp.services import sheets_storage
+
+    built = []
+    monkeypatch.setattr(
+        sheets_storage, "build", lambda *args, **kwargs: built.append(kwargs["http"])
+    )
+    creds = MagicMock(valid=True)
+
+    for _ in range(2):
+        storage = GoogleSheetsStorage("TestSheet")
+        storage.load_credentials = MagicMock(return_value=creds)
+        storage._connect()
+
+    assert len(built) == 4
+    assert len({id(http.http) for http in built}) == 1
+
+
+def test_credentials_are_parsed_once_per_instance(monkeypatch):
+    """The authorisation check and API connection should share credentials."""
+    from book_lamp.services import sheets_storage
+
+    parse = MagicMock(return_value=MagicMock(valid=True))
+    monkeypatch.setattr(sheets_storage.Credentials, "from_authorized_user_info", parse)
+    monkeypatch.setattr(sheets_storage, "build", MagicMock())
+
+    storage = GoogleSheetsStorage("TestSheet", credentials_dict={"token": "t"})
+    assert storage.is_authorised()
+    assert storage.is_authorised()
+    storage._connect()
+
+    assert parse.call_count == 1
+
+
+def test_drive_queries_escape_quotes_in_names():
+    """A sheet name containing a quote must not break the Drive query."""
+    mock_drive = MagicMock()
+    files = mock_drive.files.return_value
+    files.list.return_value.execute.return_value = {"files": []}
+    files.create.return_value.execute.return_value = {"id": "new"}
+
+    storage = GoogleSheetsStorage("Sam's Books")
+    storage.service = MagicMock()
+    storage.drive_service = mock_drive
+    storage.initialize_sheets = MagicMock()
+
+    storage._ensure_spreadsheet_id()
+
+    assert "name = 'Sam\\'s Books'" in files.list.call_args.kwargs["q"]
+
+
+def test_transient_api_errors_are_retried(monkeypatch):
+    """A 503 from the API should be retried rather than surfaced."""
+    import googleapiclient.http  # type: ignore
+    from googleapiclient.discovery import build  # type: ignore
+    from googleapiclient.http import HttpMockSequence  # type: ignore
+
+    from book_lamp.services.sheets_storage import _RetryingHttpRequest
+
+    monkeypatch.setattr(googleapiclient.http.time, "sleep", lambda _: None)
+    http = HttpMockSequence(
+        [({"status": "503"}, "unavailable"), ({"status": "200"}, '{"values": []}')]
+    )
+    service = build("sheets", "v4", http=http, requestBuilder=_RetryingHttpRequest)
+
+    result = (
+        service.spreadsheets().values().get(spreadsheetId="s", range="A1").execute()
+    )
+
+    assert result == {"values": []}
+
+
+def test_writes_are_not_retried(monkeypatch):
+    """A failed write may have been applied, so it should not be repeated."""
+    import googleapiclient.http  # type: ignore
+    from googleapiclient.discovery import build  # type: ignore
+    from googleapiclient.errors import HttpError  # type: ignore
+    from googleapiclient.http import HttpMockSequence  # type: ignore
+
+    from book_lamp.services.sheets_storage import _RetryingHttpRequest
+
+    monkeypatch.setattr(googleapiclient.http.time, "sleep", lambda _: None)
+    http = HttpMockSequence(
+        [({"status": "503"}, "unavailable"), ({"status": "200"}, "{}")]
+    )
+    service = build("sheets", "v4", http=http, requestBuilder=_RetryingHttpRequest)
+
+    with pytest.raises(HttpError):
+        service.spreadsheets().batchUpdate(spreadsheetId="s", body={}).execute()
+
+
+def test_writes_only_drop_the_tabs_they_change():
+    """Writing one tab should keep other tabs already read in this request."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {"values": [["id", "isbn13", "title"], ["1", "123", "T"]]},
+            {"values": [["id", "name"]]},
+            {"values": [["book_id", "author_id"]]},
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    storage.get_all_books()
+    storage._store_values({"ReadingRecords": [["id"]]})
+    storage._clear_persistent_cache("ReadingRecords")
+    assert "ReadingRecords" not in storage._cache
+    assert storage.get_all_books()[0]["title"] == "T"
+    assert mock_values.batchGet.call_count == 1
+
+    storage._clear_persistent_cache("Books")
     storage.get_all_books()
+    assert mock_values.batchGet.call_count == 2
+
+
+def test_consecutive_row_updates_share_one_request():
+    """Adjacent rows should be written together, keeping later writes last."""
+    storage = GoogleSheetsStorage("TestSheet")
+    storage._get_sheet_id = MagicMock(return_value=5)
+
+    requests = storage._update_rows_requests(
+        "Books", [(4, ["d"]), (2, ["b"]), (3, ["c"]), (7, ["g"]), (3, ["c2"])]
+    )
+
+    starts = [r["updateCells"]["start"]["rowIndex"] for r in requests]
+    sizes = [len(r["updateCells"]["rows"]) for r in requests]
+    assert starts == [1, 2, 6]
+    assert sizes == [2, 2, 1]
+    assert requests[1]["updateCells"]["rows"][0]["values"][0] == {
+        "userEnteredValue": {"stringValue": "c2"}
+    }
+
+
+def test_search_reads_books_and_records_in_one_call():
+    """A cold search should fetch every tab it needs with a single batchGet."""
+    mock_service = MagicMock()
+    mock_values = mock_service.spreadsheets.return_value.values.return_value
+    mock_values.batchGet.return_value.execute.return_value = {
+        "valueRanges": [
+            {
+                "values": [
+                    ["ID", "ISBN13", "Title", "Author"],
+                    ["1", "978", "Dune", "F"],
+                ]
+            },
+            {"values": [["ID", "Name"]]},
+            {"values": [["Book ID", "Author ID"]]},
+            {
+                "values": [
+                    ["ID", "Book ID", "Status", "Start", "End", "Rating", "Created"],
+                    ["1", "1", "Completed", "2024-01-01", "", "5", ""],
+                ]
+            },
+        ]
+    }
+
+    storage = GoogleSheetsStorage("TestSheet")
+    storage.service = mock_service
+    storage._ensure_spreadsheet_id = MagicMock(return_value="sid")
+
+    results = storage.search("dune")
 
-    # Should only call get() 3 times (Books, Authors, BookAuthors)
-    assert mock_values.get.call_count == 3
+    assert [book["title"] for book in results] == ["Dune"]
+    assert mock_values.batchGet.call_count == 1
+    mock_values.get.assert_not_called()
@@ -1,6 +1,10 @@
 """Tests for the search service and route."""
 
-from book_lamp.services.search import calculate_relevance_score, search_books
+from book_lamp.services.search import (
+    calculate_relevance_score,
+    compile_query,
+    search_books,
+)
 
 
 def test_search_books_by_title():
@@ -67,6 +71,22 @@ def test_search_books_by_reading_status():
     assert results[0]["title"] == "Gatsby"
 
 
+def test_search_books_attaches_only_own_records():
+    """Test that each result carries just its own reading records."""
+    books = [
+        {"id": 1, "title": "Gatsby", "author": "A"},
+        {"id": 2, "title": "Gatsby Returns", "author": "B"},
+    ]
+    records = [
+        {"id": 1, "book_id": 2, "status": "Completed"},
+        {"id": 2, "book_id": 1, "status": "In Progress"},
+        {"id": 3, "book_id": 2, "status": "Abandoned"},
+    ]
+    results = search_books(books, records, "gatsby")
+    by_id = {b["id"]: [r["id"] for r in b["reading_records"]] for b in results}
+    assert by_id == {1: [2], 2: [1, 3]}
+
+
 def test_search_relevance_scoring():
     """Test that results are sorted by relevance."""
     books = [
@@ -121,3 +141,32 @@ def test_search_route_with_empty_query(authenticated_client):
     response = authenticated_client.get("/books/search?q=", follow_redirects=False)
     assert response.status_code == 302
     assert "/books" in response.location
+
+
+def test_search_non_ascii_is_case_insensitive():
+    """Test that case-insensitive matching also applies to accented text."""
+    book = {"id": 1, "title": "LES MISÉRABLES", "author": "Victor Hugo"}
+    assert calculate_relevance_score(book, [], "misérables") > 0
+    assert calculate_relevance_score(book, [], "Hugo") > 0
+
+
+def test_compiled_query_scores_like_the_query_text():
+    """Scoring with a compiled query should match scoring with the string."""
+    book = {"id": 1, "title": "Python", "author": "Guido", "authors": ["Guido"]}
+    records = [{"book_id": 1, "status": "Completed", "rating": 5}]
+    for query in ("python", "GUIDO", "completed", "é"):
+        assert calculate_relevance_score(
+            book, records, compile_query(query)
+        ) == calculate_relevance_score(book, records, query)
+
+
+def test_search_books_limit_returns_top_results_in_order():
+    """Test that a limit keeps the highest scoring books, ties in order."""
+    books = [
+        {"id": 1, "title": "Other", "description": "Python"},
+        {"id": 2, "title": "Python"},
+        {"id": 3, "title": "Another", "description": "Python"},
+    ]
+    full = search_books(books, [], "python")
+    limited = search_books(books, [], "python", limit=2)
+    assert [b["id"] for b in limited] == [b["id"] for b in full][:2] == [2, 1]